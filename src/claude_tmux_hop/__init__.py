@@ -1,17 +1,26 @@
 """Claude Tmux Hop - Hop between Claude Code sessions in tmux panes."""
 
 import re
+from functools import lru_cache
 from pathlib import Path
 
+_VERSION_RE = re.compile(r'^version = "([^"]+)"', re.MULTILINE)
 
+
+@lru_cache(maxsize=None)
 def _get_version() -> str:
     """Get version from pyproject.toml."""
     pyproject = Path(__file__).parent.parent.parent / "pyproject.toml"
     if pyproject.exists():
-        match = re.search(r'^version = "([^"]+)"', pyproject.read_text(), re.MULTILINE)
+        match = _VERSION_RE.search(pyproject.read_text())
         if match:
             return match.group(1)
     return "0.0.0"
 
 
-__version__ = _get_version()
+def __getattr__(name: str) -> str:
+    # Resolved on first access so status-bar polling, which never builds the
+    # parser, skips reading pyproject.toml at import.
+    if name == "__version__":
+        return _get_version()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
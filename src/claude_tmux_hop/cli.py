@@ -19,7 +19,7 @@ from .priority import (
     PENDING_STATES,
     STATE_PRIORITY,
     group_by_state,
-    priority_sort_key,
+    pane_sort_key,
     sort_all_panes,
 )
 from .tmux import (
@@ -579,7 +579,7 @@ def _pending_panes(panes: list[PaneInfo]) -> list[PaneInfo]:
         p for p in panes
         if p.state in PENDING_STATES and p.timestamp > cleared_at
     ]
-    pending.sort(key=lambda p: priority_sort_key(p.state, p.timestamp))
+    pending.sort(key=pane_sort_key)
     return pending
 
 
@@ -1000,7 +1000,7 @@ def cmd_inbox(args: argparse.Namespace) -> int:
 
     actives = sorted(
         (p for p in panes if p.state not in PENDING_STATES),
-        key=lambda p: priority_sort_key(p.state, p.timestamp),
+        key=pane_sort_key,
     )
     entries = (_pending_panes(panes) + actives)[:INBOX_DISPLAY_LIMIT]
     if not entries:
@@ -1384,8 +1384,21 @@ def cmd_conductor_prompt_context(args: argparse.Namespace) -> int:
     return 0
 
 
+# Status-bar commands run on every tmux status refresh and take no
+# arguments, so they skip building the full subcommand parser.
+POLLING_COMMANDS: dict[str, Callable[[argparse.Namespace], int]] = {
+    "status": cmd_status,
+    "status-inbox": cmd_status_inbox,
+}
+
+
 def main() -> int:
     """Main entry point."""
+    argv = sys.argv[1:]
+    if len(argv) == 1 and argv[0] in POLLING_COMMANDS:
+        func = POLLING_COMMANDS[argv[0]]
+        return func(argparse.Namespace(command=argv[0], func=func))
+
     parser = create_parser(
         cmd_register=cmd_register,
         cmd_clear=cmd_clear,
@@ -1408,7 +1421,7 @@ def main() -> int:
         cmd_conductor_context=cmd_conductor_context,
         cmd_conductor_prompt_context=cmd_conductor_prompt_context,
     )
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     return args.func(args)
 
 
@@ -15,6 +15,7 @@ from .paths import (
     find_tpm_path,
     get_active_tmux_config,
     get_plugin_install_dir,
+    invalidate_caches,
 )
 
 
@@ -25,6 +26,11 @@ PLUGIN_LIST_TIMEOUT = 10
 CHECK_COMMAND_TIMEOUT = 5
 MAX_VERSION_DISPLAY_LENGTH = 50
 
+# Config scanning works on raw bytes: membership checks need no decode, and
+# configs in a non-UTF-8 locale can't raise UnicodeDecodeError mid-install.
+PLUGIN_CONFIG_MARKER = b"claude-tmux-hop"
+OH_MY_TMUX_MARKERS = (b"oh-my-tmux", b"/.tmux/.tmux.conf")
+
 
 @dataclass
 class CheckResult:
@@ -443,18 +449,16 @@ def install_tmux_plugin_tpm(tmux_conf_path: Path | None = None) -> bool:
 
     try:
         if tmux_conf_path.exists():
-            content = tmux_conf_path.read_text()
-            if plugin_line in content or "claude-tmux-hop" in content:
+            content = tmux_conf_path.read_bytes()
+            if PLUGIN_CONFIG_MARKER in content:
                 print(f"  Plugin already in {tmux_conf_path}")
                 return True
             # Check for oh-my-tmux markers - prefer .tmux.conf.local instead
-            if "oh-my-tmux" in content or "/.tmux/.tmux.conf" in content:
+            if any(marker in content for marker in OH_MY_TMUX_MARKERS):
                 tmux_conf_path = Path.home() / ".tmux.conf.local"
-                if tmux_conf_path.exists():
-                    local_content = tmux_conf_path.read_text()
-                    if plugin_line in local_content or "claude-tmux-hop" in local_content:
-                        print(f"  Plugin already in {tmux_conf_path}")
-                        return True
+                if tmux_conf_path.exists() and PLUGIN_CONFIG_MARKER in tmux_conf_path.read_bytes():
+                    print(f"  Plugin already in {tmux_conf_path}")
+                    return True
 
         # Ensure parent directory exists
         tmux_conf_path.parent.mkdir(parents=True, exist_ok=True)
@@ -513,6 +517,7 @@ def install_tmux_plugin_manual(plugin_dir: Path | None = None) -> bool:
         return True
 
     plugin_dir.mkdir(parents=True, exist_ok=True)
+    invalidate_caches()  # a memoized TPM path may predate this directory
 
     try:
         target.symlink_to(package_path)
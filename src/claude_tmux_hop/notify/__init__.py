@@ -11,6 +11,8 @@ import os
 import subprocess
 import sys
 import time
+from functools import lru_cache
+from typing import TypeVar
 
 from ..log import log_debug, log_info
 from ..tmux import (
@@ -106,11 +108,41 @@ FOCUS_DETECTORS: dict[str, type[FocusDetector]] = {
 }
 
 
+# Any of the strategy protocols registered above
+_Strategy = TypeVar("_Strategy", Notifier, FocusHandler, FocusDetector)
+
+
+@lru_cache(maxsize=None)
+def _strategy_instance(strategy_class: type[_Strategy]) -> _Strategy:
+    """Return a shared instance of a strategy class.
+
+    Strategies are stateless, so one instance per class is reused for the
+    life of the process instead of constructing one per call.
+    """
+    return strategy_class()
+
+
 # =============================================================================
 # Terminal App Detection
 # =============================================================================
 
 
+def _get_app_from_bundle(bundle_id: str) -> str | None:
+    """Map a macOS bundle ID to an app name.
+
+    Exact IDs are a single dict hit. Variants fall back to a prefix match,
+    which also covers suffixes glued onto the name (``com.jetbrains.goland.EAP``,
+    ``com.jetbrains.goland-EAP``, ``com.microsoft.VSCodeInsiders``).
+    """
+    app_name = MACOS_BUNDLE_MAP.get(bundle_id)
+    if app_name:
+        return app_name
+    for prefix, app_name in MACOS_BUNDLE_MAP.items():
+        if bundle_id.startswith(prefix):
+            return app_name
+    return None
+
+
 def _get_terminal_app(session_name: str | None = None) -> str | None:
     """Get terminal app name from config or environment.
 
@@ -146,17 +178,7 @@ def _get_terminal_app(session_name: str | None = None) -> str | None:
     # bundle ID after the user switches terminal apps.
     bundle_id = os.environ.get("__CFBundleIdentifier", "")
     if bundle_id:
-        bundle_app = None
-        # Check exact match first
-        if bundle_id in MACOS_BUNDLE_MAP:
-            bundle_app = MACOS_BUNDLE_MAP[bundle_id]
-        # Check partial match (e.g., com.jetbrains.goland.EAP)
-        if bundle_app is None:
-            for prefix, app_name in MACOS_BUNDLE_MAP.items():
-                if bundle_id.startswith(prefix):
-                    bundle_app = app_name
-                    break
-
+        bundle_app = _get_app_from_bundle(bundle_id)
         if bundle_app:
             if term_program_app and term_program_app != bundle_app:
                 return term_program_app
@@ -310,7 +332,7 @@ def is_terminal_focused(
         app_name = _get_terminal_app(session_name)
     if not app_name:
         return False
-    return detector_class().is_focused(app_name, session_name)
+    return _strategy_instance(detector_class).is_focused(app_name, session_name)
 
 
 def send_notification(title: str, message: str, on_click: PaneContext | None = None) -> bool:
@@ -327,7 +349,7 @@ def send_notification(title: str, message: str, on_click: PaneContext | None = N
     platform = get_platform()
     notifier_class = NOTIFIERS.get(platform)
     if notifier_class:
-        return notifier_class().send(title, message, on_click)
+        return _strategy_instance(notifier_class).send(title, message, on_click)
     return False
 
 
@@ -361,7 +383,7 @@ def focus_terminal(
     platform = get_platform()
     handler_class = FOCUS_HANDLERS.get(platform)
     if handler_class:
-        return handler_class().focus(app_name, session_name)
+        return _strategy_instance(handler_class).focus(app_name, session_name)
     return False
 
 
@@ -402,9 +424,10 @@ def handle_state_notifications(
     session_name = _get_tmux_session_name() if os.environ.get("TMUX") else None
     app_name = _get_terminal_app(session_name)
 
-    # Single probe gates both paths so we don't steal focus from a user
-    # already looking at the terminal.
-    already_focused = is_terminal_focused(app_name, session_name)
+    # The probe only matters for notification suppression: focusing an
+    # already-focused terminal is a no-op, so focus-only events skip the
+    # extra osascript/xdotool subprocess.
+    already_focused = is_terminal_focused(app_name, session_name) if wants_notify else False
 
     if do_focus:
         if already_focused:
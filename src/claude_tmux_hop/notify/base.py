@@ -105,7 +105,8 @@ def run_command(
     try:
         result = subprocess.run(
             args,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             timeout=timeout,
             check=False,
         )
@@ -140,3 +141,8 @@ def run_command_output(
         return None
     except (subprocess.SubprocessError, OSError):
         return None
+
+
+def window_title_matches(window_title: str, search_term: str) -> bool:
+    """Case-insensitive substring match of a search term in a window title."""
+    return search_term.casefold() in window_title.casefold()
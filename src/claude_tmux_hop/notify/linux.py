@@ -3,9 +3,8 @@
 from __future__ import annotations
 
 import os
-import shutil
 
-from .base import run_command, run_command_output, PaneContext
+from .base import run_command, run_command_output, window_title_matches, PaneContext
 
 
 class LinuxNotifier:
@@ -22,12 +21,10 @@ class LinuxNotifier:
         Returns:
             True if notification was sent successfully
         """
-        if not shutil.which("notify-send"):
-            return False
-
         # Note: notify-send --action requires libnotify 0.7.8+ and desktop support
         # For now, we don't implement click-to-focus on Linux as it requires
         # D-Bus handling which is complex. Just send a regular notification.
+        # A missing notify-send fails fast inside run_command.
         return run_command(["notify-send", title, message])
 
 
@@ -54,21 +51,20 @@ class LinuxFocusHandler:
         return self._focus_window(app_name, session_name)
 
     def _focus_window(self, app_name: str, session_name: str | None) -> bool:
-        """Focus the terminal window using wmctrl or xdotool."""
+        """Focus the terminal window using wmctrl or xdotool.
+
+        Missing tools fail fast in run_command (ENOENT), so there is no
+        separate PATH lookup before each attempt.
+        """
+        # If session_name provided, try to match window title
+        search_term = session_name if session_name else app_name
+
         # Try wmctrl first (more reliable)
-        if shutil.which("wmctrl"):
-            # If session_name provided, try to match window title
-            search_term = session_name if session_name else app_name
-            if run_command(["wmctrl", "-a", search_term]):
-                return True
+        if run_command(["wmctrl", "-a", search_term]):
+            return True
 
         # Fallback to xdotool
-        if shutil.which("xdotool"):
-            search_term = session_name if session_name else app_name
-            if run_command(["xdotool", "search", "--limit", "1", "--name", search_term, "windowactivate"]):
-                return True
-
-        return False
+        return run_command(["xdotool", "search", "--limit", "1", "--name", search_term, "windowactivate"])
 
 
 class LinuxFocusDetector:
@@ -93,10 +89,7 @@ class LinuxFocusDetector:
             # Return False to always show notification (safe default)
             return False
 
-        # X11: use xdotool
-        if not shutil.which("xdotool"):
-            return False  # Can't detect, assume not focused
-
+        # X11: use xdotool (None when missing → assume not focused)
         active_window = run_command_output(
             ["xdotool", "getactivewindow", "getwindowname"]
         )
@@ -106,4 +99,4 @@ class LinuxFocusDetector:
 
         # Check if window name contains app name or session name
         search_term = session_name if session_name else app_name
-        return search_term.lower() in active_window.lower()
+        return window_title_matches(active_window, search_term)
@@ -39,6 +39,8 @@ MACOS_APP_BUNDLE_NAMES = {
 
 _APP_BUNDLE_RE = re.compile(r"/([^/]+)\.app/")
 
+_APPLESCRIPT_ESCAPE = str.maketrans({"\\": "\\\\", '"': '\\"'})
+
 
 def _escape_applescript_string(s: str) -> str:
     """Escape a string for use inside AppleScript double quotes.
@@ -51,8 +53,7 @@ def _escape_applescript_string(s: str) -> str:
     Returns:
         The escaped string safe for AppleScript double-quoted strings
     """
-    # Escape backslashes first, then double quotes
-    return s.replace("\\", "\\\\").replace('"', '\\"')
+    return s.translate(_APPLESCRIPT_ESCAPE)
 
 
 def _run_osascript(script: str) -> bool:
@@ -67,7 +68,8 @@ def _run_osascript(script: str) -> bool:
     try:
         result = subprocess.run(
             ["osascript", "-e", script],
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             timeout=SUBPROCESS_TIMEOUT,
             check=False,
         )
@@ -299,10 +301,10 @@ def detect_terminal_app_via_tmux_client(
 
     # Multiple clients can share a session; prefer the most-recently-active one.
     lines.sort(reverse=True)
-    parts = lines[0].split("\t", 1)
-    if len(parts) < 2 or not parts[1]:
+    _, _, client_pid = lines[0].partition("\t")
+    if not client_pid:
         return None
-    return _walk_pid_to_terminal_app(parts[1])
+    return _walk_pid_to_terminal_app(client_pid)
 
 
 def _focus_running_app_process(process_name: str) -> bool:
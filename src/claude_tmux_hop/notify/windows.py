@@ -1,11 +1,142 @@
-"""Windows notification and focus handlers using PowerShell."""
+"""Windows notification and focus handlers using user32 and PowerShell."""
 
 from __future__ import annotations
 
-import html
+import ctypes
+import shutil
 import subprocess
+import sys
+from functools import lru_cache
+
+from .base import SUBPROCESS_TIMEOUT_LONG, PaneContext, window_title_matches
+
+_POWERSHELL_FLAGS = ("-NoLogo", "-NoProfile", "-NonInteractive", "-ExecutionPolicy", "Bypass")
+
+# Toast XML sits inside a single-quoted here-string, where PowerShell treats
+# everything literally, so only XML escaping is needed. Escaping ' as well
+# also rules out a premature '@ terminator.
+_XML_ESCAPE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#x27;",
+})
+
+# Simple toast (click-to-focus not supported on Windows)
+_TOAST_SCRIPT = """
+[Windows.UI.Notifications.ToastNotificationManager, Windows.UI.Notifications, ContentType = WindowsRuntime] | Out-Null
+[Windows.Data.Xml.Dom.XmlDocument, Windows.Data.Xml.Dom.XmlDocument, ContentType = WindowsRuntime] | Out-Null
+$template = @'
+<toast>
+    <visual>
+        <binding template="ToastText02">
+            <text id="1">{title}</text>
+            <text id="2">{message}</text>
+        </binding>
+    </visual>
+</toast>
+'@
+$xml = New-Object Windows.Data.Xml.Dom.XmlDocument
+$xml.LoadXml($template)
+$toast = [Windows.UI.Notifications.ToastNotification]::new($xml)
+[Windows.UI.Notifications.ToastNotificationManager]::CreateToastNotifier('Claude Code').Show($toast)
+"""
 
-from .base import SUBPROCESS_TIMEOUT_LONG, PaneContext
+WINDOW_TITLE_MAX = 512
+SW_RESTORE = 9
+
+
+@lru_cache(maxsize=None)
+def _find_powershell(allow_core: bool = True) -> str | None:
+    """Locate a PowerShell executable, preferring PowerShell 7 (pwsh).
+
+    pwsh cold-starts noticeably faster than Windows PowerShell 5.1 but cannot
+    load WinRT types, so toast notifications pass allow_core=False. Resolved
+    lazily because this module is imported on every platform; None (e.g. under
+    WSL without interop) lets callers bail out without spawning anything.
+    """
+    if allow_core:
+        pwsh = shutil.which("pwsh")
+        if pwsh:
+            return pwsh
+    return shutil.which("powershell")
+
+
+def _powershell_args(script: str, allow_core: bool = True) -> list[str] | None:
+    """Build the argv for running a PowerShell script, or None if unavailable."""
+    executable = _find_powershell(allow_core)
+    if executable is None:
+        return None
+    return [executable, *_POWERSHELL_FLAGS, "-Command", script]
+
+
+@lru_cache(maxsize=None)
+def _user32():
+    """Load user32 through ctypes, or None when not running on Windows."""
+    if sys.platform != "win32":
+        return None
+    try:
+        # wintypes is only meaningful (and only guaranteed importable) on Windows
+        from ctypes import wintypes
+
+        user32 = ctypes.WinDLL("user32", use_last_error=True)
+    except (ImportError, OSError, AttributeError):
+        return None
+
+    user32.GetForegroundWindow.argtypes = []
+    user32.GetForegroundWindow.restype = wintypes.HWND
+    user32.GetWindowTextW.argtypes = [wintypes.HWND, wintypes.LPWSTR, ctypes.c_int]
+    user32.GetWindowTextW.restype = ctypes.c_int
+    user32.IsWindowVisible.argtypes = [wintypes.HWND]
+    user32.IsIconic.argtypes = [wintypes.HWND]
+    user32.ShowWindow.argtypes = [wintypes.HWND, ctypes.c_int]
+    user32.SetForegroundWindow.argtypes = [wintypes.HWND]
+    user32.GetWindowThreadProcessId.argtypes = [wintypes.HWND, ctypes.c_void_p]
+    user32.GetWindowThreadProcessId.restype = wintypes.DWORD
+    user32.AttachThreadInput.argtypes = [wintypes.DWORD, wintypes.DWORD, wintypes.BOOL]
+    return user32
+
+
+def _window_text(user32, hwnd) -> str:
+    buf = ctypes.create_unicode_buffer(WINDOW_TITLE_MAX)
+    user32.GetWindowTextW(hwnd, buf, WINDOW_TITLE_MAX)
+    return buf.value
+
+
+def _find_window(user32, search_term: str):
+    """Return the first visible top-level window whose title contains search_term."""
+    found = []
+
+    def on_window(hwnd, _lparam):
+        if user32.IsWindowVisible(hwnd) and window_title_matches(_window_text(user32, hwnd), search_term):
+            found.append(hwnd)
+            return False  # stop enumeration
+        return True
+
+    callback = ctypes.WINFUNCTYPE(ctypes.c_bool, ctypes.c_void_p, ctypes.c_void_p)(on_window)
+    user32.EnumWindows(callback, 0)
+    return found[0] if found else None
+
+
+def _activate_window(user32, hwnd) -> bool:
+    """Restore and raise a window, working around the foreground lock."""
+    if user32.IsIconic(hwnd):
+        user32.ShowWindow(hwnd, SW_RESTORE)
+    if user32.SetForegroundWindow(hwnd):
+        return True
+
+    # Windows only lets the foreground thread change the foreground window;
+    # temporarily share its input state so the request is honored.
+    foreground_thread = user32.GetWindowThreadProcessId(user32.GetForegroundWindow(), None)
+    current_thread = ctypes.WinDLL("kernel32").GetCurrentThreadId()
+    if not foreground_thread or foreground_thread == current_thread:
+        return False
+    user32.AttachThreadInput(current_thread, foreground_thread, True)
+    try:
+        return bool(user32.SetForegroundWindow(hwnd))
+    finally:
+        user32.AttachThreadInput(current_thread, foreground_thread, False)
 
 
 class WindowsNotifier:
@@ -29,36 +160,18 @@ class WindowsNotifier:
             which is beyond the scope of this tool. The on_click parameter is
             accepted for API compatibility but ignored.
         """
-        title_escaped = html.escape(title)
-        message_escaped = html.escape(message)
-
-        # Build simple toast XML (click-to-focus not supported on Windows)
-        toast_xml = f'''
-<toast>
-    <visual>
-        <binding template="ToastText02">
-            <text id="1">{title_escaped}</text>
-            <text id="2">{message_escaped}</text>
-        </binding>
-    </visual>
-</toast>
-'''
+        ps_script = _TOAST_SCRIPT.format(
+            title=title.translate(_XML_ESCAPE),
+            message=message.translate(_XML_ESCAPE),
+        )
 
-        ps_script = f"""
-[Windows.UI.Notifications.ToastNotificationManager, Windows.UI.Notifications, ContentType = WindowsRuntime] | Out-Null
-[Windows.Data.Xml.Dom.XmlDocument, Windows.Data.Xml.Dom.XmlDocument, ContentType = WindowsRuntime] | Out-Null
-$template = @'
-{toast_xml}
-'@
-$xml = New-Object Windows.Data.Xml.Dom.XmlDocument
-$xml.LoadXml($template)
-$toast = [Windows.UI.Notifications.ToastNotification]::new($xml)
-[Windows.UI.Notifications.ToastNotificationManager]::CreateToastNotifier('Claude Code').Show($toast)
-"""
+        args = _powershell_args(ps_script, allow_core=False)
+        if args is None:
+            return False
 
         try:
             result = subprocess.run(
-                ["powershell", "-NoProfile", "-NonInteractive", "-Command", ps_script],
+                args,
                 capture_output=True,
                 timeout=SUBPROCESS_TIMEOUT_LONG,
                 check=False,
@@ -69,7 +182,7 @@ $toast = [Windows.UI.Notifications.ToastNotification]::new($xml)
 
 
 class WindowsFocusHandler:
-    """Focus terminal windows on Windows using PowerShell COM automation.
+    """Focus terminal windows on Windows via user32 (PowerShell fallback).
 
     Only handles OS-level window focus. Tmux pane navigation is handled
     separately by the auto-hop path so both can run independently on the
@@ -80,22 +193,24 @@ class WindowsFocusHandler:
         """Bring an application to the foreground on Windows.
 
         Args:
-            app_name: Name of the application (window title or process name)
+            app_name: Name of the application (matched against window titles)
             session_name: Optional tmux session name (unused on Windows)
 
         Returns:
             True if focus was successful
 
         Note:
-            This uses WScript.Shell.AppActivate which may not work reliably with
-            all terminal applications. Windows Terminal, ConEmu, and some other
-            terminals have specific window management that may interfere with
-            COM automation. If focus fails, the user may need to manually switch
-            to the terminal window.
+            Windows restricts which processes may take the foreground. If
+            SetForegroundWindow is refused even after attaching to the
+            foreground thread's input, the user may need to switch manually.
         """
-        return self._focus_window(app_name)
+        user32 = _user32()
+        if user32 is None:
+            return self._focus_window_powershell(app_name)
+        hwnd = _find_window(user32, app_name)
+        return bool(hwnd) and _activate_window(user32, hwnd)
 
-    def _focus_window(self, app_name: str) -> bool:
+    def _focus_window_powershell(self, app_name: str) -> bool:
         """Bring application window to foreground using COM automation."""
         app_escaped = app_name.replace("'", "''").replace("`", "``")
 
@@ -104,9 +219,13 @@ $wshell = New-Object -ComObject WScript.Shell
 $wshell.AppActivate('{app_escaped}')
 """
 
+        args = _powershell_args(ps_script)
+        if args is None:
+            return False
+
         try:
             result = subprocess.run(
-                ["powershell", "-NoProfile", "-NonInteractive", "-Command", ps_script],
+                args,
                 capture_output=True,
                 timeout=SUBPROCESS_TIMEOUT_LONG,
                 check=False,
@@ -120,9 +239,10 @@ class WindowsFocusDetector:
     """Detect if Windows terminal window is currently focused."""
 
     def is_focused(self, app_name: str, session_name: str | None = None) -> bool:
-        """Check if the terminal window is focused using PowerShell.
+        """Check if the terminal window is focused.
 
-        Gets the foreground window title and checks if it matches.
+        Reads the foreground window title via user32 in-process, falling back
+        to PowerShell when ctypes can't load user32.
 
         Args:
             app_name: Name of the application to check
@@ -131,6 +251,20 @@ class WindowsFocusDetector:
         Returns:
             True if the terminal window is focused
         """
+        user32 = _user32()
+        if user32 is not None:
+            hwnd = user32.GetForegroundWindow()
+            window_title = _window_text(user32, hwnd) if hwnd else ""
+        else:
+            window_title = self._foreground_title_powershell()
+
+        if not window_title:
+            return False  # Assume not focused if detection fails
+        search_term = session_name if session_name else app_name
+        return window_title_matches(window_title, search_term)
+
+    def _foreground_title_powershell(self) -> str:
+        """Get the foreground window title through a PowerShell P/Invoke shim."""
         ps_script = """
 Add-Type @"
 using System;
@@ -152,19 +286,21 @@ $sb = New-Object System.Text.StringBuilder 256
 $sb.ToString()
 """
 
+        args = _powershell_args(ps_script)
+        if args is None:
+            return ""
+
         try:
             result = subprocess.run(
-                ["powershell", "-NoProfile", "-NonInteractive", "-Command", ps_script],
+                args,
                 capture_output=True,
                 text=True,
                 timeout=SUBPROCESS_TIMEOUT_LONG,
                 check=False,
             )
-            if result.returncode == 0 and result.stdout:
-                window_title = result.stdout.strip()
-                search_term = session_name if session_name else app_name
-                return search_term.lower() in window_title.lower()
+            if result.returncode == 0:
+                return result.stdout.strip()
         except (subprocess.SubprocessError, OSError):
             pass
 
-        return False  # Assume not focused if detection fails
+        return ""
@@ -5,7 +5,7 @@ from __future__ import annotations
 import argparse
 from typing import TYPE_CHECKING
 
-from . import __version__
+from . import _get_version
 from .priority import VALID_CYCLE_MODES, VALID_STATES
 
 if TYPE_CHECKING:
@@ -53,7 +53,7 @@ def create_parser(
     parser.add_argument(
         "--version",
         action="version",
-        version=f"%(prog)s {__version__}",
+        version=f"%(prog)s {_get_version()}",
     )
 
     subparsers = parser.add_subparsers(dest="command", required=True)
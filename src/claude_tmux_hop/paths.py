@@ -7,9 +7,23 @@ from __future__ import annotations
 
 import os
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 
+TPM_ENV_VAR = "TMUX_PLUGIN_MANAGER_PATH"
+# tmux answers in milliseconds; a longer wait only masks a wedged server
+TMUX_QUERY_TIMEOUT = 1
 
+
+def invalidate_caches() -> None:
+    """Drop memoized path lookups (after env changes, or in tests)."""
+    get_xdg_config_home.cache_clear()
+    get_tmux_config_paths.cache_clear()
+    get_tpm_env_path.cache_clear()
+    get_tpm_plugin_paths.cache_clear()
+
+
+@lru_cache(maxsize=None)
 def get_xdg_config_home() -> Path:
     """Get XDG_CONFIG_HOME, defaulting to ~/.config."""
     return Path(os.environ.get("XDG_CONFIG_HOME", Path.home() / ".config"))
@@ -20,7 +34,8 @@ def get_default_conductor_dir() -> Path:
     return get_xdg_config_home() / "claude-tmux-hop" / "conductor"
 
 
-def get_tmux_config_paths() -> list[Path]:
+@lru_cache(maxsize=None)
+def get_tmux_config_paths() -> tuple[Path, ...]:
     """Return all possible tmux config file paths in priority order.
 
     tmux searches in this order (first found wins):
@@ -42,13 +57,15 @@ def get_tmux_config_paths() -> list[Path]:
     ]
 
     # Deduplicate while preserving order (XDG default can duplicate entry 3)
-    return list(dict.fromkeys(paths))
+    return tuple(dict.fromkeys(paths))
 
 
 def get_active_tmux_config() -> Path | None:
     """Find the active tmux configuration file.
 
-    Returns the first existing config file from the search order.
+    Returns the first existing config file from the search order. Not cached:
+    the installer may create config files and plugin dirs mid-run, so lookups
+    that probe the filesystem stay live.
     """
     for path in get_tmux_config_paths():
         if path.exists():
@@ -56,40 +73,53 @@ def get_active_tmux_config() -> Path | None:
     return None
 
 
+def _existing_tpm_path(path_str: str) -> Path | None:
+    # Expand ~ if present; remove trailing slash for consistency
+    path = Path(os.path.expanduser(path_str.strip()).rstrip("/"))
+    return path if path.exists() else None
+
+
+@lru_cache(maxsize=None)
 def get_tpm_env_path() -> Path | None:
     """Get TPM path from tmux environment variable.
 
     TPM sets TMUX_PLUGIN_MANAGER_PATH when initialized.
     This is the most reliable detection method when inside tmux.
+    Panes spawned after TPM loaded inherit it, so the process environment
+    is checked before asking the tmux server.
+    Cached: the tmux global environment doesn't change within one run, but
+    the existence probe can go stale, so the installer calls
+    invalidate_caches() after creating a plugin dir.
     """
     if "TMUX" not in os.environ:
         return None
 
+    env_value = os.environ.get(TPM_ENV_VAR)
+    if env_value:
+        path = _existing_tpm_path(env_value)
+        if path:
+            return path
+
     try:
         result = subprocess.run(
-            ["tmux", "show-environment", "-g", "TMUX_PLUGIN_MANAGER_PATH"],
+            ["tmux", "show-environment", "-g", TPM_ENV_VAR],
             capture_output=True,
             text=True,
-            timeout=5,
+            timeout=TMUX_QUERY_TIMEOUT,
         )
         if result.returncode == 0:
             # Output format: "TMUX_PLUGIN_MANAGER_PATH=/path/to/plugins"
             line = result.stdout.strip()
             if "=" in line and not line.startswith("-"):
-                path_str = line.split("=", 1)[1].strip()
-                # Expand ~ if present
-                path_str = os.path.expanduser(path_str)
-                # Remove trailing slash for consistency
-                path = Path(path_str.rstrip("/"))
-                if path.exists():
-                    return path
+                return _existing_tpm_path(line.split("=", 1)[1])
     except (subprocess.TimeoutExpired, FileNotFoundError):
         pass
 
     return None
 
 
-def get_tpm_plugin_paths() -> list[Path]:
+@lru_cache(maxsize=None)
+def get_tpm_plugin_paths() -> tuple[Path, ...]:
     """Return all possible TPM plugin directory paths in priority order.
 
     Checks:
@@ -114,16 +144,10 @@ def get_tpm_plugin_paths() -> list[Path]:
     # Traditional location (most common)
     paths.append(Path.home() / ".tmux" / "plugins")
 
-    # Deduplicate while preserving order
-    seen: set[Path] = set()
-    unique: list[Path] = []
-    for p in paths:
-        resolved = p.resolve() if p.exists() else p
-        if resolved not in seen:
-            seen.add(resolved)
-            unique.append(p)
-
-    return unique
+    # Deduplicate while preserving order. Plain path equality is enough for
+    # these home-rooted candidates; a symlinked duplicate only costs one
+    # extra probe, cheaper than stat+resolve on every candidate.
+    return tuple(dict.fromkeys(paths))
 
 
 def find_tpm_path() -> Path | None:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import sys
+from operator import attrgetter
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -59,7 +60,8 @@ def group_by_state(panes: list[PaneInfo]) -> dict[str, list[PaneInfo]]:
 
 def sort_within_group(panes: list[PaneInfo]) -> list[PaneInfo]:
     """Sort panes in a state group, newest timestamp first."""
-    return sorted(panes, key=lambda p: -p.timestamp)
+    # reverse=True keeps ties in input order, same as keying on -timestamp
+    return sorted(panes, key=attrgetter("timestamp"), reverse=True)
 
 
 def get_cycle_group(panes: list[PaneInfo], mode: str = "priority") -> list[PaneInfo]:
@@ -93,13 +95,13 @@ def get_cycle_group(panes: list[PaneInfo], mode: str = "priority") -> list[PaneI
     return []
 
 
-def priority_sort_key(state: str, timestamp: int) -> tuple[int, int]:
+def pane_sort_key(pane: PaneInfo) -> tuple[int, int]:
     """Return a sort key for priority-ordered display and cycling.
 
-    All states sort newest first within their priority bucket.
+    All states sort newest first within their priority bucket. Takes the
+    pane itself so it can be passed straight to `sort(key=...)`.
     """
-    priority = STATE_PRIORITY.get(state, 2)
-    return (priority, -timestamp)
+    return (STATE_PRIORITY.get(pane.state, 2), -pane.timestamp)
 
 
 def sort_all_panes(panes: list[PaneInfo]) -> list[PaneInfo]:
@@ -111,4 +113,4 @@ def sort_all_panes(panes: list[PaneInfo]) -> list[PaneInfo]:
     Returns:
         Sorted list: waiting -> idle -> active, each group newest first
     """
-    return sorted(panes, key=lambda p: priority_sort_key(p.state, p.timestamp))
+    return sorted(panes, key=pane_sort_key)
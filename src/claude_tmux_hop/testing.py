@@ -5,6 +5,7 @@ from __future__ import annotations
 import argparse
 import io
 import json
+import subprocess
 import tempfile
 from contextlib import redirect_stdout, redirect_stderr
 from dataclasses import dataclass
@@ -179,15 +180,15 @@ def validate_hooks_json() -> list[TestResult]:
         )
 
     # Check that all hooks use the correct command pattern
+    # (all() stops at the first offending hook)
     command_pattern = "claude-tmux-hop"
-    all_commands_valid = True
-    for event, hook_list in hooks.items():
-        for hook_entry in hook_list:
-            for hook in hook_entry.get("hooks", []):
-                if hook.get("type") == "command":
-                    cmd = hook.get("command", "")
-                    if command_pattern not in cmd:
-                        all_commands_valid = False
+    all_commands_valid = all(
+        command_pattern in hook.get("command", "")
+        for hook_list in hooks.values()
+        for hook_entry in hook_list
+        for hook in hook_entry.get("hooks", [])
+        if hook.get("type") == "command"
+    )
 
     results.append(
         TestResult(
@@ -315,6 +316,25 @@ def test_terminal_detection() -> list[TestResult]:
                 f"Expected Ghostty, got {app}",
             )
         )
+
+        bundle_cases = [
+            ("com.jetbrains.intellij.ce", "IntelliJ IDEA CE"),
+            ("com.jetbrains.goland.EAP", "GoLand"),
+            ("com.jetbrains.goland-EAP", "GoLand"),
+            ("com.jetbrains.intellij-EAP", "IntelliJ IDEA"),
+            ("com.microsoft.VSCodeInsiders", "Visual Studio Code"),
+            ("dev.zed.Zed-Nightly", "Zed"),
+            ("com.example.unknown", None),
+        ]
+        for bundle_id, expected in bundle_cases:
+            app = notify._get_app_from_bundle(bundle_id)
+            results.append(
+                TestResult(
+                    f"terminal_detection_bundle__{bundle_id}",
+                    app == expected,
+                    f"Expected {expected!r}, got {app!r}",
+                )
+            )
     finally:
         notify.get_global_option = original_get_global_option
         notify.os.environ.clear()
@@ -387,6 +407,155 @@ def test_macos_focus_behaviors() -> list[TestResult]:
     return results
 
 
+def test_linux_focus_detection() -> list[TestResult]:
+    """Test Linux focus detection (unit test, no xdotool required)."""
+    from .notify import linux
+
+    results = []
+    original_output = linux.run_command_output
+    original_environ = dict(linux.os.environ)
+
+    try:
+        linux.os.environ.pop("WAYLAND_DISPLAY", None)
+        linux.run_command_output = lambda args, timeout=5: "user@host: Claude-Session"
+        detector = linux.LinuxFocusDetector()
+        results.append(TestResult(
+            "linux_focus__session_title_case_insensitive",
+            detector.is_focused("Ghostty", "claude-session"),
+            "Session name matches the active window title regardless of case",
+        ))
+        results.append(TestResult(
+            "linux_focus__other_session_not_focused",
+            not detector.is_focused("Ghostty", "other"),
+            "Unrelated session name is not treated as focused",
+        ))
+
+        # Missing xdotool surfaces as None from run_command_output
+        linux.run_command_output = lambda args, timeout=5: None
+        results.append(TestResult(
+            "linux_focus__missing_tool_not_focused",
+            not detector.is_focused("Ghostty", "claude-session"),
+            "Detection failure assumes not focused",
+        ))
+    finally:
+        linux.run_command_output = original_output
+        linux.os.environ.clear()
+        linux.os.environ.update(original_environ)
+
+    return results
+
+
+def test_windows_powershell_args() -> list[TestResult]:
+    """Test PowerShell executable selection (unit test, no PowerShell required)."""
+    from .notify import windows
+
+    results = []
+    original_which = windows.shutil.which
+    installed = {"pwsh": "C:/pwsh.exe", "powershell": "C:/powershell.exe"}
+
+    try:
+        windows.shutil.which = installed.get
+        windows._find_powershell.cache_clear()
+
+        args = windows._powershell_args("Get-Date")
+        results.append(TestResult(
+            "windows_ps__prefers_pwsh",
+            args[0] == "C:/pwsh.exe" and args[-2:] == ["-Command", "Get-Date"],
+            f"Expected pwsh with -Command script, got {args}",
+        ))
+        args = windows._powershell_args("Get-Date", allow_core=False)
+        results.append(TestResult(
+            "windows_ps__toast_uses_windows_powershell",
+            args[0] == "C:/powershell.exe",
+            f"Expected Windows PowerShell for WinRT scripts, got {args[0]}",
+        ))
+        results.append(TestResult(
+            "windows_ps__fast_start_flags",
+            "-NoLogo" in args and "-NoProfile" in args,
+            f"Expected -NoLogo/-NoProfile, got {args}",
+        ))
+
+        windows.shutil.which = lambda name: None
+        windows._find_powershell.cache_clear()
+        results.append(TestResult(
+            "windows_ps__missing_short_circuits",
+            windows._powershell_args("Get-Date") is None
+            and windows.WindowsNotifier().send("t", "m") is False,
+            "Without PowerShell no subprocess is attempted",
+        ))
+    finally:
+        windows.shutil.which = original_which
+        windows._find_powershell.cache_clear()
+
+    return results
+
+
+def test_windows_focus_detection() -> list[TestResult]:
+    """Test Windows focus detection and activation via user32 (fake bindings)."""
+    from .notify import windows
+
+    results = []
+
+    class FakeUser32:
+        def __init__(self, title: str) -> None:
+            self.title = title
+
+        def GetForegroundWindow(self) -> int:
+            return 1
+
+        def GetWindowTextW(self, hwnd, buf, size) -> int:
+            buf.value = self.title
+            return len(self.title)
+
+    original_user32 = windows._user32
+    original_find = windows._find_window
+    original_activate = windows._activate_window
+    original_ps = windows.WindowsFocusDetector._foreground_title_powershell
+    ps_calls: list[bool] = []
+
+    try:
+        windows.WindowsFocusDetector._foreground_title_powershell = (
+            lambda self: ps_calls.append(True) or ""
+        )
+        windows._user32 = lambda: FakeUser32("claude-session - Windows Terminal")
+        detector = windows.WindowsFocusDetector()
+        results.append(TestResult(
+            "windows_focus__user32_title_match",
+            detector.is_focused("WindowsTerminal", "Claude-Session") and not ps_calls,
+            "Foreground title read in-process matches the session name",
+        ))
+
+        windows._user32 = lambda: None
+        results.append(TestResult(
+            "windows_focus__powershell_fallback",
+            not detector.is_focused("WindowsTerminal", "claude-session") and bool(ps_calls),
+            "Without user32 the PowerShell shim is used",
+        ))
+
+        activated: list[int] = []
+        windows._user32 = lambda: FakeUser32("")
+        windows._find_window = lambda user32, term: 42 if term == "WindowsTerminal" else None
+        windows._activate_window = lambda user32, hwnd: activated.append(hwnd) or True
+        handler = windows.WindowsFocusHandler()
+        results.append(TestResult(
+            "windows_focus__activates_matching_window",
+            handler.focus("WindowsTerminal") and activated == [42],
+            f"Expected window 42 activated, got {activated}",
+        ))
+        results.append(TestResult(
+            "windows_focus__no_matching_window",
+            not handler.focus("Missing") and activated == [42],
+            "No matching window reports failure without activating",
+        ))
+    finally:
+        windows._user32 = original_user32
+        windows._find_window = original_find
+        windows._activate_window = original_activate
+        windows.WindowsFocusDetector._foreground_title_powershell = original_ps
+
+    return results
+
+
 def test_macos_terminal_app_from_process_tree() -> list[TestResult]:
     """Test macOS terminal app detection from process executable paths."""
     from .notify import macos
@@ -1363,6 +1532,416 @@ def test_send_prompt_blocks_active_pane() -> list[TestResult]:
     return results
 
 
+def test_claude_tty_scan() -> list[TestResult]:
+    """Interactive claude ttys are picked out of one `ps` listing."""
+    from .tmux import _claude_ttys_from_ps
+
+    ps_output = "\n".join([
+        "pts/1    claude",
+        "pts/2    /usr/local/bin/claude --resume abc",
+        "pts/3    claude -p summarize",
+        "pts/4    claude --print",
+        "?        claude",
+        "pts/5    vim claude",
+        "pts/6    -zsh",
+        "",
+    ])
+    ttys = _claude_ttys_from_ps(ps_output)
+    return [TestResult(
+        "claude_tty_scan__interactive_only",
+        ttys == {"pts/1", "pts/2"},
+        f"Expected {{'pts/1', 'pts/2'}}, got {ttys}",
+    )]
+
+
+def test_claude_tty_proc_scan() -> list[TestResult]:
+    """The Linux /proc walk finds the same ttys `ps` would report."""
+    from . import tmux
+
+    pts3 = 136 << 8 | 3
+    # Kernel new_encode_dev(136, 300): minor bits above the low byte sit at 20+
+    pts300 = (300 & 0xff) | 136 << 8 | (300 & ~0xff) << 12
+    procs = {
+        "100": (b"claude\0", b"100 (claude) S 1 100 100 %d 0" % pts3),
+        "101": (b"/usr/bin/claude\0--resume\0abc\0", b"101 (my (odd) comm) S 1 1 1 %d 0" % pts300),
+        "102": (b"claude\0-p\0hi\0", b"102 (claude) S 1 1 1 %d 0" % pts3),
+        "103": (b"claude\0", b"103 (claude) S 1 1 1 0 0"),
+        "104": (b"-zsh\0", b"104 (zsh) S 1 1 1 %d 0" % pts3),
+        "105": (b"", b"105 (kthreadd) S 0 0 0 0 0"),
+    }
+
+    original_proc_dir = tmux.PROC_DIR
+    try:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for pid, (cmdline, stat) in procs.items():
+                (Path(tmpdir) / pid).mkdir()
+                (Path(tmpdir) / pid / "cmdline").write_bytes(cmdline)
+                (Path(tmpdir) / pid / "stat").write_bytes(stat)
+            (Path(tmpdir) / "self").mkdir()
+            (Path(tmpdir) / "106").mkdir()  # exited mid-scan: no files
+
+            tmux.PROC_DIR = tmpdir
+            ttys = tmux._claude_ttys_from_proc()
+            tmux.PROC_DIR = str(Path(tmpdir) / "missing")
+            unreadable = tmux._claude_ttys_from_proc()
+    finally:
+        tmux.PROC_DIR = original_proc_dir
+
+    return [
+        TestResult(
+            "claude_tty_proc_scan__interactive_only",
+            ttys == {"pts/3", "pts/300"},
+            f"Expected {{'pts/3', 'pts/300'}}, got {ttys}",
+        ),
+        TestResult(
+            "claude_tty_proc_scan__unreadable_is_none",
+            unreadable is None,
+            f"Expected None when /proc is unreadable, got {unreadable}",
+        ),
+    ]
+
+
+def test_claude_tty_scan_cache() -> list[TestResult]:
+    """Repeated process lookups within one run share a single scan."""
+    from . import tmux
+
+    results = []
+    scans = []
+    scan_result: set[str] | None = None
+
+    def fake_scan():
+        scans.append(1)
+        return scan_result
+
+    original_scan = tmux._scan_claude_ttys
+    try:
+        tmux._scan_claude_ttys = fake_scan
+
+        tmux.invalidate_running_cache()
+        scan_result = {"pts/1"}
+        first = tmux._interactive_claude_ttys()
+        second = tmux._interactive_claude_ttys()
+        results.append(TestResult(
+            "claude_tty_cache__reused_within_ttl",
+            first == second == {"pts/1"} and len(scans) == 1,
+            f"Expected one scan returning {{'pts/1'}}, got {len(scans)} scans: {first}, {second}",
+        ))
+
+        tmux.invalidate_running_cache()
+        tmux._interactive_claude_ttys()
+        results.append(TestResult(
+            "claude_tty_cache__invalidate_rescans",
+            len(scans) == 2,
+            f"Expected a rescan after invalidation, got {len(scans)} scans",
+        ))
+
+        tmux.invalidate_running_cache()
+        scan_result = None
+        tmux._interactive_claude_ttys()
+        scan_result = {"pts/2"}
+        recovered = tmux._interactive_claude_ttys()
+        results.append(TestResult(
+            "claude_tty_cache__failure_not_cached",
+            recovered == {"pts/2"} and len(scans) == 4,
+            f"Expected a failed scan to be retried, got {recovered} after {len(scans)} scans",
+        ))
+    finally:
+        tmux._scan_claude_ttys = original_scan
+        tmux.invalidate_running_cache()
+
+    return results
+
+
+def test_stale_panes_single_listing() -> list[TestResult]:
+    """Stale and validated hop panes each come from one listing plus one process scan."""
+    from . import tmux
+
+    list_panes_output = "\n".join([
+        # pane_id\ttty\tstate\tts\tcwd\tsession\twindow\ttask\treason\tproject\tbranch
+        "%1\t/dev/pts/1\twaiting\t1700000000\t/repo/a\tmain\t0\t\t\t\t",
+        "%2\t/dev/pts/2\tidle\t1700000010\t/repo/b\tmain\t1\t\t\t\t",
+        "%3\t/dev/pts/3\t\t\t/repo/c\tmain\t2\t\t\t\t",
+        # A tab inside the cwd must not move the tty of a live pane
+        "%4\t/dev/pts/4\twaiting\t1700000020\t/repo/with\ttab\tmain\t3\t\t\t\t",
+    ])
+    list_calls = []
+
+    def fake_run_tmux(*args, check=True, quiet=False):
+        if args[0] == "list-panes":
+            list_calls.append(args)
+            return list_panes_output
+        return ""
+
+    original_run_tmux = tmux.run_tmux
+    original_ttys = tmux._interactive_claude_ttys
+    original_settings = tmux._get_listing_settings
+    try:
+        tmux.run_tmux = fake_run_tmux
+        tmux._interactive_claude_ttys = lambda: {"pts/1", "pts/3", "pts/4"}
+        tmux._get_listing_settings = lambda: ("conductor", True)
+        stale_ids = [p.id for p in tmux.get_stale_panes()]
+        stale_calls = len(list_calls)
+        list_calls.clear()
+        live_ids = [p.id for p in tmux.get_hop_panes(validate=True)]
+    finally:
+        tmux.run_tmux = original_run_tmux
+        tmux._interactive_claude_ttys = original_ttys
+        tmux._get_listing_settings = original_settings
+
+    return [
+        TestResult(
+            "stale_panes__one_list_panes",
+            stale_ids == ["%2"] and stale_calls == 1,
+            f"Expected ['%2'] from one list-panes, got {stale_ids} from {stale_calls}",
+        ),
+        TestResult(
+            "hop_panes_validate__one_list_panes",
+            live_ids == ["%1", "%4"] and len(list_calls) == 1,
+            f"Expected ['%1', '%4'] from one list-panes, got {live_ids} from {len(list_calls)}",
+        ),
+    ]
+
+
+def test_hop_panes_filter_fallback() -> list[TestResult]:
+    """`get_hop_panes()` filters server-side; old tmux is probed once per server."""
+    from . import tmux
+
+    results = []
+    row = "%1\t/dev/pts/1\twaiting\t1700000000\t/repo/a\tmain\t0"
+    server_options: dict[str, str] = {}
+    calls = []
+    errors = []
+
+    def make_fake(reject_filter):
+        # Stands in for subprocess.run so run_tmux's own error path is exercised
+        def fake_run(argv, stdout=None, stderr=None, check=False):
+            args = argv[1:]
+            if args[0] == "display-message":
+                flag = "1" if server_options.get(tmux.LIST_FILTER_OPTION) == "off" else "0"
+                return subprocess.CompletedProcess(argv, 0, f"{flag}\tconductor\n".encode(), b"")
+            calls.append(args)
+            if reject_filter and "-f" in args:
+                raise subprocess.CalledProcessError(1, argv, b"", b"unknown flag -f")
+            if args[0] == "set-option":
+                server_options[args[2]] = args[3]
+            return subprocess.CompletedProcess(argv, 0, row.encode(), b"")
+        return fake_run
+
+    original_run = tmux.subprocess.run
+    original_log_error = tmux.log_error
+    try:
+        tmux.log_error = errors.append
+
+        tmux.subprocess.run = make_fake(reject_filter=False)
+        ids = [p.id for p in tmux.get_hop_panes(validate=False)]
+        results.append(TestResult(
+            "hop_panes_filter__server_side",
+            ids == ["%1"] and len(calls) == 1 and tmux.HOP_STATE_FILTER in calls[0],
+            f"Expected one filtered list-panes, got {calls}",
+        ))
+
+        calls.clear()
+        tmux.subprocess.run = make_fake(reject_filter=True)
+        ids = [p.id for p in tmux.get_hop_panes(validate=False)]
+        results.append(TestResult(
+            "hop_panes_filter__fallback_persisted",
+            ids == ["%1"] and len(calls) == 2
+            and server_options.get(tmux.LIST_FILTER_OPTION) == "off",
+            f"Expected filtered probe then one chained set-option/list-panes, got {calls}",
+        ))
+
+        # A later process learns the rejection from the server option
+        calls.clear()
+        ids = [p.id for p in tmux.get_hop_panes(validate=False)]
+        results.append(TestResult(
+            "hop_panes_filter__second_process_skips_probe",
+            ids == ["%1"] and len(calls) == 1 and "-f" not in calls[0],
+            f"Expected one unfiltered list-panes, got {calls}",
+        ))
+        results.append(TestResult(
+            "hop_panes_filter__probe_not_logged",
+            errors == [],
+            f"Expected no error log for the -f probe, got {errors}",
+        ))
+    finally:
+        tmux.subprocess.run = original_run
+        tmux.log_error = original_log_error
+
+    return results
+
+
+def test_switch_to_pane_targeted_lookup() -> list[TestResult]:
+    """`switch_to_pane` without a session resolves only the target pane."""
+    from . import tmux
+
+    results = []
+    calls = []
+
+    def fake_run_tmux(*args, check=True, quiet=False):
+        calls.append(args)
+        if args[0] == "display-message" and "-t" in args:
+            if "%404" in args:
+                raise RuntimeError("can't find pane: %404")
+            return "work\t3"
+        if args[0] == "display-message" and "-p" in args:
+            return "%0\tmain\t0"  # current pane / session / window
+        return ""
+
+    original_run_tmux = tmux.run_tmux
+    original_run = tmux.subprocess.run
+    original_log_error = tmux.log_error
+    try:
+        tmux.run_tmux = fake_run_tmux
+        ok = tmux.switch_to_pane("%7", store_previous=False)
+        results.append(TestResult(
+            "switch_to_pane__display_message_lookup",
+            ok and not any(c[0] == "list-panes" for c in calls)
+            and ("switch-client", "-t", "work:3", ";", "select-pane", "-t", "%7") in calls,
+            f"Expected a targeted lookup then one chained switch to work:3, got {calls}",
+        ))
+
+        calls.clear()
+        ok = tmux.switch_to_pane("%7", "main", 1)
+        lookups = [c for c in calls if c[0] == "display-message"]
+        results.append(TestResult(
+            "switch_to_pane__one_current_location_lookup",
+            ok and len(lookups) == 1 and calls[-1] == (
+                "select-window", "-t", "main:1", ";", "select-pane", "-t", "%7",
+                ";", "set-option", "-g", "@hop-previous-pane", "%0",
+            ),
+            f"Expected one display-message and one chained switch storing origin %0, got {calls}",
+        ))
+
+        calls.clear()
+        missing = tmux.switch_to_pane("%404", store_previous=False)
+        results.append(TestResult(
+            "switch_to_pane__missing_pane",
+            missing is False and not any(c[0] in ("switch-client", "select-pane") for c in calls),
+            f"Expected False without navigating, got {missing} with {calls}",
+        ))
+
+        # Through the real run_tmux: a closed pane must not log at error level
+        errors = []
+
+        def fake_run(argv, stdout=None, stderr=None, check=False):
+            if "-t" in argv and "%404" in argv:
+                raise subprocess.CalledProcessError(1, argv, b"", b"can't find pane: %404")
+            out = b"%0\tmain\t0\n" if argv[1] == "display-message" and "-p" in argv else b""
+            return subprocess.CompletedProcess(argv, 0, out, b"")
+
+        tmux.run_tmux = original_run_tmux
+        tmux.subprocess.run = fake_run
+        tmux.log_error = errors.append
+        missing = tmux.switch_to_pane("%404", store_previous=False)
+        results.append(TestResult(
+            "switch_to_pane__missing_pane_not_logged",
+            missing is False and errors == [],
+            f"Expected False with no error log, got {missing} with {errors}",
+        ))
+    finally:
+        tmux.run_tmux = original_run_tmux
+        tmux.subprocess.run = original_run
+        tmux.log_error = original_log_error
+
+    return results
+
+
+def test_write_only_tmux_chains() -> list[TestResult]:
+    """Only chains made entirely of write commands skip stdout capture."""
+    from .tmux import _is_write_only
+
+    cases = [
+        (("set-option", "-p", "@hop-task", "x"), True),
+        (("select-window", "-t", "s:1", ";", "select-pane", "-t", "%1"), True),
+        (("show-option", "-pqv", "@hop-state", ";", "set-option", "-p", "@hop-state", "idle"), False),
+        (("display-message", "-p", "#{pane_id}"), False),
+        ((), False),
+    ]
+    results = []
+    for args, expected in cases:
+        got = _is_write_only(args)
+        results.append(TestResult(
+            f"write_only__{args[0] if args else 'empty'}_{len(args)}",
+            got == expected,
+            f"Expected {expected} for {args}, got {got}",
+        ))
+    return results
+
+
+def test_batched_pane_capture() -> list[TestResult]:
+    """Stale waiting panes are captured in one chained tmux call."""
+    import time
+
+    from . import tmux
+    from .tmux import PaneInfo
+
+    results = []
+    old = int(time.time()) - tmux.WAITING_STALE_THRESHOLD - 1
+    screens = {
+        "%1": "Do you want to proceed?\n❯ 1. Yes\n  2. No\n───\n  status",
+        "%2": "done.\n───\n❯ \n───\n  status",
+    }
+    calls = []
+    writes = []
+
+    def fake_run_tmux(*args, check=True):
+        calls.append(args)
+        if args[0] == "display-message":
+            out = []
+            cmds = " ".join(args).split(" ; ")
+            for cmd in cmds:
+                if cmd.startswith("display-message"):
+                    out.append(tmux.CAPTURE_SENTINEL)
+                elif cmd.startswith("capture-pane"):
+                    pane_id = cmd.split()[2]
+                    if pane_id not in screens:
+                        break  # tmux stops the chain at a failing command
+                    out.append(screens[pane_id])
+            return "\n".join(out).strip()
+        if args[0] == "capture-pane":
+            return screens.get(args[2], "")
+        if args[0] == "show-option":
+            writes.append(args)
+            return "waiting"
+        return ""
+
+    original_run_tmux = tmux.run_tmux
+    try:
+        tmux.run_tmux = fake_run_tmux
+
+        panes = [
+            PaneInfo("%1", "waiting", old, "", "s", 0),
+            PaneInfo("%2", "waiting", old, "", "s", 1),
+            PaneInfo("%3", "idle", old, "", "s", 2),
+        ]
+        tmux.validate_waiting_panes(panes)
+        states = [p.state for p in panes]
+        results.append(TestResult(
+            "batched_capture__one_call",
+            len(calls) == 2 and states == ["waiting", "idle", "idle"],
+            f"Expected one capture call + one write flipping %2, got {calls} -> {states}",
+        ))
+        written_ts = writes[0][writes[0].index("@hop-timestamp") + 1] if writes else None
+        results.append(TestResult(
+            "batched_capture__shared_timestamp",
+            written_ts == str(panes[1].timestamp),
+            f"Expected the flip to record {panes[1].timestamp}, got {written_ts}",
+        ))
+
+        calls.clear()
+        contents = tmux.capture_panes_content(["%1", "%gone", "%2"])
+        results.append(TestResult(
+            "batched_capture__chain_stop_fallback",
+            contents == {"%1": screens["%1"], "%gone": "", "%2": screens["%2"]}
+            and [c[0] for c in calls] == ["display-message", "capture-pane"],
+            f"Expected per-pane fallback for %2 only, got {contents} via {calls}",
+        ))
+    finally:
+        tmux.run_tmux = original_run_tmux
+
+    return results
+
+
 def test_conductor_session_excluded() -> list[TestResult]:
     """Conductor-session panes are filtered out of `get_hop_panes()`."""
     from . import tmux
@@ -1370,25 +1949,25 @@ def test_conductor_session_excluded() -> list[TestResult]:
     results = []
 
     list_panes_output = "\n".join([
-        # pane_id\tstate\tts\tcwd\tsession\twindow\ttask
-        "%1\twaiting\t1700000000\t/repo/a\tmain\t0\t",
-        "%conduct\tidle\t1700000010\t/work\tconductor\t0\t",
-        "%2\tactive\t1700000020\t/repo/b\tmain\t1\t",
+        # pane_id\ttty\tstate\tts\tcwd\tsession\twindow\ttask\treason\tproject\tbranch
+        "%1\t/dev/pts/1\twaiting\t1700000000\t/repo/a\tmain\t0\t\t\t\t",
+        "%conduct\t/dev/pts/9\tidle\t1700000010\t/work\tconductor\t0\t\t\t\t",
+        "%2\t/dev/pts/2\tactive\t1700000020\t/repo/b\tmain\t1\t\t\t\t",
     ])
 
-    def fake_run_tmux(*args, check=True):
+    def fake_run_tmux(*args, check=True, quiet=False):
         if args[0] == "list-panes":
             return list_panes_output
         return ""
 
     original_run_tmux = tmux.run_tmux
-    original_running = tmux.get_running_claude_pane_ids
-    original_session = tmux._get_conductor_session
+    original_ttys = tmux._interactive_claude_ttys
+    original_settings = tmux._get_listing_settings
 
     try:
         tmux.run_tmux = fake_run_tmux
-        tmux.get_running_claude_pane_ids = lambda: {"%1", "%conduct", "%2"}
-        tmux._get_conductor_session = lambda: "conductor"
+        tmux._interactive_claude_ttys = lambda: {"pts/1", "pts/9", "pts/2"}
+        tmux._get_listing_settings = lambda: ("conductor", True)
 
         panes = tmux.get_hop_panes(validate=True)
         ids = [p.id for p in panes]
@@ -1405,8 +1984,8 @@ def test_conductor_session_excluded() -> list[TestResult]:
         ))
     finally:
         tmux.run_tmux = original_run_tmux
-        tmux.get_running_claude_pane_ids = original_running
-        tmux._get_conductor_session = original_session
+        tmux._interactive_claude_ttys = original_ttys
+        tmux._get_listing_settings = original_settings
 
     return results
 
@@ -1648,6 +2227,53 @@ def test_notify_dedup_cooldown() -> list[TestResult]:
     return results
 
 
+def test_focus_probe_gating() -> list[TestResult]:
+    """The focused-terminal probe runs only when a notification may be sent."""
+    from . import notify
+
+    results = []
+    probes = []
+    focused = []
+
+    patches = {
+        "_get_tmux_session_name": lambda: "main",
+        "_get_terminal_app": lambda session_name=None: "ghostty",
+        "is_terminal_focused": lambda app_name=None, session_name=None: probes.append(app_name) or False,
+        "focus_terminal": lambda app_name=None, session_name=None: focused.append(app_name) or True,
+        "send_notification": lambda title, message, on_click=None: True,
+        "_is_duplicate_notification": lambda pane_id, fingerprint: False,
+        "_stamp_notification": lambda pane_id, fingerprint: None,
+    }
+    originals = {name: getattr(notify, name) for name in (*patches, "should_focus_app", "should_notify")}
+    try:
+        for name, fake in patches.items():
+            setattr(notify, name, fake)
+
+        notify.should_focus_app = lambda state: False
+        notify.should_notify = lambda state: True
+        notify.handle_state_notifications("waiting", "proj")
+        results.append(TestResult(
+            "focus_probe__runs_for_notification",
+            probes == ["ghostty"] and not focused,
+            f"Expected one probe and no focus, got probes={probes} focused={focused}",
+        ))
+
+        probes.clear()
+        notify.should_focus_app = lambda state: True
+        notify.should_notify = lambda state: False
+        notify.handle_state_notifications("waiting", "proj")
+        results.append(TestResult(
+            "focus_probe__skipped_focus_only",
+            probes == [] and focused == ["ghostty"],
+            f"Expected focus without a probe, got probes={probes} focused={focused}",
+        ))
+    finally:
+        for name, original in originals.items():
+            setattr(notify, name, original)
+
+    return results
+
+
 def test_set_pane_state_transition() -> list[TestResult]:
     """set_pane_state reports whether the state actually changed.
 
@@ -1702,6 +2328,16 @@ def test_set_pane_state_transition() -> list[TestResult]:
             tmux.set_pane_state("idle", "%1") is False,
             "Trailing tmux output whitespace must not count as a change",
         ))
+
+        calls: list[tuple] = []
+        tmux.run_tmux = lambda *args, check=True: calls.append(args) or ""
+        tmux.clear_pane_state("%1")
+        unset = [calls[0][i + 1] for i, a in enumerate(calls[0]) if a == "-u"] if calls else []
+        results.append(TestResult(
+            "clear_pane_state__single_invocation",
+            len(calls) == 1 and "@hop-state" in unset and "@hop-timestamp" in unset,
+            f"Expected one chained unset call, got {len(calls)} call(s): {unset}",
+        ))
     finally:
         tmux.run_tmux = original
 
@@ -1974,16 +2610,16 @@ def test_self_heal_ps_failure() -> list[TestResult]:
     now = int(time.time())
 
     # get_stale_panes: unknown liveness → nothing is stale.
-    original_running = tmux.get_running_claude_pane_ids
+    original_ttys = tmux._interactive_claude_ttys
     try:
-        tmux.get_running_claude_pane_ids = lambda: None
+        tmux._interactive_claude_ttys = lambda: None
         results.append(TestResult(
             "ps_failure__get_stale_panes_empty",
             tmux.get_stale_panes() == [],
             f"Expected [] on scan failure, got {tmux.get_stale_panes()}",
         ))
     finally:
-        tmux.get_running_claude_pane_ids = original_running
+        tmux._interactive_claude_ttys = original_ttys
 
     # cmd_inbox: killed-claude candidates can't be judged without ps —
     # every stateful pane is shown and none gets its state cleared.
@@ -2222,43 +2858,182 @@ def test_pending_panes() -> list[TestResult]:
     return results
 
 
+def test_polling_command_fast_path() -> list[TestResult]:
+    """Bare `status`/`status-inbox` skip the parser; anything else uses argparse."""
+    from . import cli
+
+    results = []
+    dispatched = []
+    parsers_built = []
+
+    def counting_create_parser(**handlers):
+        parsers_built.append(True)
+        return original_create_parser(**handlers)
+
+    original_argv = cli.sys.argv
+    original_create_parser = cli.create_parser
+    original_commands = dict(cli.POLLING_COMMANDS)
+    try:
+        cli.create_parser = counting_create_parser
+        for name in original_commands:
+            cli.POLLING_COMMANDS[name] = lambda args: dispatched.append(args.command) or 0
+
+        for name in ("status", "status-inbox"):
+            dispatched.clear()
+            parsers_built.clear()
+            cli.sys.argv = ["claude-tmux-hop", name]
+            rc = cli.main()
+            results.append(TestResult(
+                f"polling_fast_path__{name}",
+                rc == 0 and dispatched == [name] and not parsers_built,
+                f"Expected dispatch without a parser, got rc={rc} "
+                f"dispatched={dispatched} parsers={len(parsers_built)}",
+            ))
+
+        for extra, expected_code in (("--help", 0), ("-x", 2)):
+            dispatched.clear()
+            parsers_built.clear()
+            cli.sys.argv = ["claude-tmux-hop", "status", extra]
+            code = None
+            with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
+                try:
+                    cli.main()
+                except SystemExit as e:
+                    code = e.code
+            results.append(TestResult(
+                f"polling_fast_path__argparse_{extra.lstrip('-')}",
+                code == expected_code and bool(parsers_built) and not dispatched,
+                f"Expected argparse exit {expected_code}, got {code} "
+                f"dispatched={dispatched} parsers={len(parsers_built)}",
+            ))
+    finally:
+        cli.sys.argv = original_argv
+        cli.create_parser = original_create_parser
+        cli.POLLING_COMMANDS.update(original_commands)
+
+    return results
+
+
+def test_path_cache_invalidation() -> list[TestResult]:
+    """Memoized path lookups are reused until `invalidate_caches()` runs."""
+    from . import paths
+
+    results = []
+    original_environ = dict(paths.os.environ)
+    original_run = paths.subprocess.run
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            plugins = Path(tmp) / "plugins"
+            paths.os.environ["TMUX"] = "/tmp/tmux-test,1,0"
+            paths.os.environ[paths.TPM_ENV_VAR] = str(plugins)
+            # The server has no TPM variable either, so only the env path counts
+            paths.subprocess.run = lambda *args, **kwargs: subprocess.CompletedProcess(args, 1, "", "")
+            paths.invalidate_caches()
+
+            results.append(TestResult(
+                "path_cache__memoized",
+                paths.get_tmux_config_paths() is paths.get_tmux_config_paths(),
+                "Expected the same tuple from repeated get_tmux_config_paths()",
+            ))
+
+            before = paths.get_tpm_env_path()
+            plugins.mkdir()
+            cached = paths.get_tpm_env_path()
+            paths.invalidate_caches()
+            fresh = paths.get_tpm_env_path()
+            results.append(TestResult(
+                "path_cache__invalidate_sees_new_path",
+                before is None and cached is None and fresh == plugins,
+                f"Expected None, None, {plugins}; got {before}, {cached}, {fresh}",
+            ))
+
+            # A manual install into a not-yet-existing TPM dir must be visible
+            # to lookups in the same run, not hidden by the memoized probe.
+            from .install import install_tmux_plugin_manual
+
+            new_plugins = Path(tmp) / "tpm-plugins"
+            paths.os.environ["HOME"] = str(Path(tmp) / "home")
+            paths.os.environ["XDG_CONFIG_HOME"] = str(Path(tmp) / "xdg")
+            paths.os.environ[paths.TPM_ENV_VAR] = str(new_plugins)
+            paths.invalidate_caches()
+            before_install = paths.find_plugin_path("claude-tmux-hop")
+            with redirect_stdout(io.StringIO()):
+                installed = install_tmux_plugin_manual(new_plugins)
+            after_install = paths.find_plugin_path("claude-tmux-hop")
+            results.append(TestResult(
+                "path_cache__install_sees_new_plugin_dir",
+                installed and before_install is None
+                and after_install == new_plugins / "claude-tmux-hop",
+                f"Expected None then {new_plugins / 'claude-tmux-hop'}; "
+                f"got {before_install}, {after_install} (installed={installed})",
+            ))
+    finally:
+        paths.subprocess.run = original_run
+        paths.os.environ.clear()
+        paths.os.environ.update(original_environ)
+        paths.invalidate_caches()
+
+    return results
+
+
+# Registry of self-tests in run order; run_all_tests() calls each one.
+ALL_TESTS = (
+    test_state_transitions,
+    test_priority_sorting,
+    test_dialog_detection,
+    test_terminal_detection,
+    test_macos_terminal_app_from_process_tree,
+    test_terminal_detection_prefers_tmux_client,
+    test_macos_focus_behaviors,
+    test_linux_focus_detection,
+    test_windows_powershell_args,
+    test_windows_focus_detection,
+    test_pane_context_resolution,
+    test_normalize_task,
+    test_extract_task_from_transcript,
+    test_git_identity,
+    test_inbox_lines_alignment,
+    test_status_inbox_line,
+    test_inbox_self_heal,
+    test_self_heal_ps_failure,
+    test_inbox_identity_backfill,
+    test_inbox_includes_active,
+    test_pending_panes,
+    test_cmd_list_json,
+    test_register_arg_parsing,
+    test_state_icon_from_status_format,
+    test_best_window_state,
+    test_notify_dedup_cooldown,
+    test_focus_probe_gating,
+    test_set_pane_state_transition,
+    test_spawn_task_arg_parsing,
+    test_send_prompt_arg_parsing,
+    test_conductor_arg_parsing,
+    test_update_instructions,
+    test_conductor_context,
+    test_conductor_prompt_context,
+    test_send_prompt_blocks_active_pane,
+    test_claude_tty_scan,
+    test_claude_tty_proc_scan,
+    test_claude_tty_scan_cache,
+    test_stale_panes_single_listing,
+    test_hop_panes_filter_fallback,
+    test_switch_to_pane_targeted_lookup,
+    test_batched_pane_capture,
+    test_write_only_tmux_chains,
+    test_conductor_session_excluded,
+    test_spawn_window_session_target_disambiguation,
+    test_path_cache_invalidation,
+    test_polling_command_fast_path,
+    validate_hooks_json,
+)
+
+
 def run_all_tests() -> tuple[list[TestResult], int, int]:
     """Run all tests and return (results, passed, failed)."""
     all_results: list[TestResult] = []
-    all_results.extend(test_state_transitions())
-    all_results.extend(test_priority_sorting())
-    all_results.extend(test_dialog_detection())
-    all_results.extend(test_terminal_detection())
-    all_results.extend(test_macos_terminal_app_from_process_tree())
-    all_results.extend(test_terminal_detection_prefers_tmux_client())
-    all_results.extend(test_macos_focus_behaviors())
-    all_results.extend(test_pane_context_resolution())
-    all_results.extend(test_normalize_task())
-    all_results.extend(test_extract_task_from_transcript())
-    all_results.extend(test_git_identity())
-    all_results.extend(test_inbox_lines_alignment())
-    all_results.extend(test_status_inbox_line())
-    all_results.extend(test_inbox_self_heal())
-    all_results.extend(test_self_heal_ps_failure())
-    all_results.extend(test_inbox_identity_backfill())
-    all_results.extend(test_inbox_includes_active())
-    all_results.extend(test_pending_panes())
-    all_results.extend(test_cmd_list_json())
-    all_results.extend(test_register_arg_parsing())
-    all_results.extend(test_state_icon_from_status_format())
-    all_results.extend(test_best_window_state())
-    all_results.extend(test_notify_dedup_cooldown())
-    all_results.extend(test_set_pane_state_transition())
-    all_results.extend(test_spawn_task_arg_parsing())
-    all_results.extend(test_send_prompt_arg_parsing())
-    all_results.extend(test_conductor_arg_parsing())
-    all_results.extend(test_update_instructions())
-    all_results.extend(test_conductor_context())
-    all_results.extend(test_conductor_prompt_context())
-    all_results.extend(test_send_prompt_blocks_active_pane())
-    all_results.extend(test_conductor_session_excluded())
-    all_results.extend(test_spawn_window_session_target_disambiguation())
-    all_results.extend(validate_hooks_json())
+    for test in ALL_TESTS:
+        all_results.extend(test())
 
     passed = sum(1 for r in all_results if r.passed)
     failed = len(all_results) - passed
@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import os
 import subprocess
+import sys
 import time
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -12,6 +14,7 @@ from .log import log_debug, log_error, log_info
 
 # Dialog detection constants
 PROMPT_CHAR = "❯"  # Claude Code input prompt / Ink selection cursor (U+276F)
+PROMPT_PREFIX = f"{PROMPT_CHAR} "  # Prompt line with input typed after it
 STATUS_SEPARATOR = "─"  # Box drawing character in status bar separator (U+2500)
 WAITING_STALE_THRESHOLD = 30  # Seconds a pane must stay "waiting" before we
 # capture-pane and verify the dialog is still active. Tuned to keep the
@@ -30,11 +33,60 @@ TRUTHY_VALUES = {"on", "1", "true", "yes"}
 
 WINDOW_NAME_MAX = 20  # Max chars for auto-renamed window names
 
-
-
-@dataclass
+PROCESS_SCAN_TTL = 0.5  # Seconds a claude process scan is reused within one run
+PROC_DIR = "/proc"  # Linux procfs, read directly instead of forking ps
+PTS_MAJOR = 136  # Unix98 pty slaves: one major, pts/N is minor N (20-bit)
+
+# (monotonic timestamp, ttys) of the last successful process scan
+_claude_ttys_cache: tuple[float, set[str]] | None = None
+
+# Server-side filter keeping only panes with hop state; list-panes -f
+# needs a newer tmux than the 3.0 floor, so the first listing probes it and
+# a rejection is remembered in a server option for every later process.
+HOP_STATE_FILTER = "#{!=:#{@hop-state},}"
+LIST_FILTER_OPTION = "@hop-list-filter"
+# Read before each hop listing in one display-message; the leading 0/1 flag
+# is never empty, so run_tmux's strip cannot shift the conductor column.
+HOP_LISTING_FORMAT = "#{==:#{@hop-list-filter},off}\t#{@hop-conductor-session}"
+
+# list-panes/display-message -F formats (tab-separated; parsed by _tsv_rows)
+HOP_PANES_FORMAT = "\t".join((
+    "#{pane_id}",
+    "#{pane_tty}",  # ahead of the free-text fields so a stray tab cannot shift it
+    "#{@hop-state}",
+    "#{@hop-timestamp}",
+    "#{pane_current_path}",
+    "#{session_name}",
+    "#{window_index}",
+    "#{@hop-task}",
+    "#{@hop-wait-reason}",
+    "#{@hop-project}",
+    "#{@hop-branch}",
+))
+HOP_ROW_FIELDS = HOP_PANES_FORMAT.count("\t") + 1
+CLAUDE_PANES_FORMAT = "#{pane_id}\t#{pane_tty}\t#{pane_current_path}\t#{session_name}\t#{window_index}"
+SESSION_WINDOW_FORMAT = "#{session_name}\t#{window_index}"
+CURRENT_LOCATION_FORMAT = "#{pane_id}\t#{session_name}\t#{window_index}"
+# Printed between batched captures; no '#' or '%' so tmux prints it verbatim
+CAPTURE_SENTINEL = "<<hop-capture>>"
+
+# Read-only tmux commands run_tmux does not log (they run on every poll)
+QUIET_TMUX_COMMANDS = frozenset({"list-panes", "show-option", "display-message"})
+# Commands that never write to stdout; chains made only of these skip the pipe
+WRITE_ONLY_TMUX_COMMANDS = frozenset({
+    "set-option", "select-pane", "select-window", "switch-client",
+    "rename-window", "send-keys",
+})
+
+
+
+@dataclass(slots=True)
 class PaneInfo:
-    """Information about a tmux pane with hop state."""
+    """Information about a tmux pane with hop state.
+
+    Slotted because one is built per hop pane on every query; not frozen,
+    since validate_waiting_panes updates state in place.
+    """
 
     id: str  # e.g., "%99"
     state: str  # "waiting", "idle", "active"
@@ -46,6 +98,7 @@ class PaneInfo:
     wait_reason: str = ""  # Why the pane is waiting (question/plan/permission/elicitation)
     repo: str = ""  # Main-repo name from @hop-project (set on waiting/idle register)
     branch: str = ""  # Branch from @hop-branch (set on waiting/idle register)
+    tty: str = ""  # Controlling tty, e.g. "/dev/pts/3"
 
     @property
     def project(self) -> str:
@@ -66,28 +119,58 @@ def parse_state_set(value: str) -> set[str]:
 
 
 
-def run_tmux(*args: str, check: bool = True) -> str:
+def _tsv_rows(output: str, fields: int, min_fields: int | None = None) -> Iterator[list[str]]:
+    """Yield tab-separated rows of `tmux -F` output, skipping short lines.
+
+    Each row is split at most `fields - 1` times so the last field keeps any
+    embedded tabs. Rows with fewer than `min_fields` (default: `fields`)
+    columns are dropped, which also covers blank lines.
+    """
+    required = fields if min_fields is None else min_fields
+    for line in output.splitlines():
+        parts = line.split("\t", fields - 1)
+        if len(parts) >= required:
+            yield parts
+
+
+def _is_write_only(args: tuple[str, ...]) -> bool:
+    """Whether every command in a (possibly ";"-chained) argv is write-only."""
+    if not args:
+        return False
+    commands = {args[0]}
+    commands.update(args[i + 1] for i in range(len(args) - 1) if args[i] == ";")
+    return commands <= WRITE_ONLY_TMUX_COMMANDS
+
+
+def run_tmux(*args: str, check: bool = True, quiet: bool = False) -> str:
     """Run a tmux command and return stdout.
 
+    quiet=True skips the error log for failures the caller expects and
+    handles itself (the RuntimeError is still raised).
+
     Raises:
         RuntimeError: If check=True and the command fails
     """
     try:
+        # Bytes + fsdecode: pane paths are arbitrary filesystem bytes, and
+        # surrogateescape keeps a non-UTF-8 path from raising mid-listing.
+        # stderr is always piped so failures can be reported.
         result = subprocess.run(
             ["tmux", *args],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL if _is_write_only(args) else subprocess.PIPE,
+            stderr=subprocess.PIPE,
             check=check,
         )
-        output = result.stdout.strip()
-        # Log non-query commands (skip list-panes, show-option, display-message -p)
+        output = os.fsdecode(result.stdout).strip() if result.stdout else ""
+        # Log non-query commands
         cmd = args[0] if args else ""
-        if cmd not in ("list-panes", "show-option", "display-message"):
+        if cmd not in QUIET_TMUX_COMMANDS:
             log_debug(f"tmux {' '.join(args[:3])}...")
         return output
     except subprocess.CalledProcessError as e:
-        stderr = e.stderr.strip() if e.stderr else "No error message"
-        log_error(f"tmux failed: {' '.join(args[:3])}... -> {stderr}")
+        stderr = os.fsdecode(e.stderr).strip() if e.stderr else "No error message"
+        if not quiet:
+            log_error(f"tmux failed: {' '.join(args[:3])}... -> {stderr}")
         raise RuntimeError(
             f"tmux command failed: tmux {' '.join(args)}\nError: {stderr}"
         ) from e
@@ -106,17 +189,42 @@ def get_current_pane() -> str | None:
         return None
 
 
+def _get_current_location() -> tuple[str | None, str, int | None]:
+    """Get the current pane, session and window in one display-message.
+
+    Returns:
+        Tuple of (pane_id, session_name, window_index); ("" / None) parts
+        when tmux can't resolve a current client context.
+    """
+    try:
+        info = run_tmux("display-message", "-p", CURRENT_LOCATION_FORMAT)
+    except RuntimeError:
+        return None, "", None
+    pane_id, _, rest = info.partition("\t")
+    session, _, window_str = rest.partition("\t")
+    try:
+        window = int(window_str) if window_str else None
+    except ValueError:
+        window = None
+    return pane_id or None, session, window
+
+
 def is_in_tmux() -> bool:
     """Check if we're running inside tmux."""
     return "TMUX" in os.environ
 
 
-def get_current_session_window(pane_id: str | None = None) -> tuple[str, int | None]:
+def get_current_session_window(
+    pane_id: str | None = None,
+    quiet: bool = False,
+) -> tuple[str, int | None]:
     """Get a tmux session name and window index.
 
     Args:
         pane_id: Optional pane ID to query. When omitted, tmux uses the current
             command context.
+        quiet: Skip the error log when the lookup fails (e.g. a closed pane
+            the caller handles itself); RuntimeError is still raised.
 
     Returns:
         Tuple of (session_name, window_index). Window may be None if parsing fails.
@@ -126,12 +234,12 @@ def get_current_session_window(pane_id: str | None = None) -> tuple[str, int | N
         "display-message",
         *target,
         "-p",
-        "#{session_name}\t#{window_index}",
+        SESSION_WINDOW_FORMAT,
+        quiet=quiet,
     )
-    parts = current_info.split("\t", maxsplit=1)
-    session = parts[0] if parts else ""
+    session, _, window_str = current_info.partition("\t")
     try:
-        window = int(parts[1]) if len(parts) > 1 and parts[1] else None
+        window = int(window_str) if window_str else None
     except ValueError:
         window = None
     return session, window
@@ -151,22 +259,29 @@ def _get_pane_id(pane_id: str | None) -> str | None:
     return os.environ.get("TMUX_PANE")
 
 
-def _pane_target_args(pane_id: str | None) -> list[str]:
+def _pane_target_args(pane_id: str | None) -> tuple[str, ...]:
     """Return target args for pane option commands.
 
     Uses TMUX_PANE env var if pane_id is None.
     """
     resolved = _get_pane_id(pane_id)
-    return ["-t", resolved] if resolved else []
+    return ("-t", resolved) if resolved else ()
 
 
-def set_pane_state(state: str, pane_id: str | None = None, reason: str = "") -> bool:
+def set_pane_state(
+    state: str,
+    pane_id: str | None = None,
+    reason: str = "",
+    timestamp: int | None = None,
+) -> bool:
     """Set the hop state for a pane, returning whether the state changed.
 
     Args:
         state: The state to set ("waiting", "idle", "active")
         pane_id: The pane ID, or None for current pane
         reason: Why the pane is waiting (stored only for "waiting" state)
+        timestamp: Unix time to record; defaults to now. Batch updates pass
+            one shared value so sibling flips carry the same timestamp.
 
     Returns:
         True if the new state differs from the pane's previous @hop-state
@@ -175,14 +290,14 @@ def set_pane_state(state: str, pane_id: str | None = None, reason: str = "") ->
         (e.g. a repeated idle_prompt after Stop) doesn't re-yank focus.
     """
     target = _pane_target_args(pane_id)
-    timestamp = str(int(time.time()))
+    timestamp_str = str(int(time.time()) if timestamp is None else timestamp)
     # Single tmux invocation: a leading show-option emits the prior state on
     # stdout, then the ";"-chained set-options overwrite it silently (unsetting
     # a never-set option mid-chain does not abort the chain). register is the
     # hot path (every hook event), so the read + 3 writes share one subprocess.
     args = ["show-option", "-pqv", *target, "@hop-state",
             ";", "set-option", "-p", *target, "@hop-state", state,
-            ";", "set-option", "-p", *target, "@hop-timestamp", timestamp]
+            ";", "set-option", "-p", *target, "@hop-timestamp", timestamp_str]
     if state == "waiting" and reason:
         args += [";", "set-option", "-p", *target, "@hop-wait-reason", reason]
     else:
@@ -302,7 +417,7 @@ def get_window_states(pane_id: str | None = None) -> list[str]:
     """
     target = _pane_target_args(pane_id)
     output = run_tmux("list-panes", *target, "-F", "#{@hop-state}", check=False)
-    return [state for state in output.split("\n") if state]
+    return [state for state in output.splitlines() if state]
 
 
 def get_global_option(name: str, default: str = "") -> str:
@@ -496,6 +611,17 @@ def _get_conductor_session() -> str:
     return get_global_option("@hop-conductor-session", "conductor")
 
 
+def _get_listing_settings() -> tuple[str, bool]:
+    """Conductor session name and whether list-panes -f may be tried.
+
+    One display-message replaces the separate conductor show-option, so
+    remembering the -f capability costs no extra fork.
+    """
+    output = run_tmux("display-message", "-p", HOP_LISTING_FORMAT, check=False)
+    filter_off, _, conductor = output.partition("\t")
+    return conductor or "conductor", filter_off != "1"
+
+
 def _is_conductor_enabled() -> bool:
     """Whether the conductor feature is enabled via `@hop-conductor-enabled`."""
     return get_global_option("@hop-conductor-enabled", "off").strip().lower() in TRUTHY_VALUES
@@ -556,15 +682,95 @@ def send_prompt_to_pane(pane_id: str, prompt: str, switch: bool = True) -> None:
             log_debug(f"send-prompt: switch_to_pane failed: {e}")
 
 
+def invalidate_running_cache() -> None:
+    """Drop the memoized claude process scan so the next lookup rescans."""
+    global _claude_ttys_cache
+    _claude_ttys_cache = None
+
+
 def _interactive_claude_ttys() -> set[str] | None:
-    """Find every tty hosting an interactive Claude Code session in one ps scan.
+    """Find every tty hosting an interactive Claude Code session.
+
+    A single CLI run often asks more than once (e.g. prune and then a
+    validated get_hop_panes), so a successful scan is reused for
+    PROCESS_SCAN_TTL seconds. Failures are never cached.
+    """
+    global _claude_ttys_cache
+    now = time.monotonic()
+    if _claude_ttys_cache is not None and now - _claude_ttys_cache[0] < PROCESS_SCAN_TTL:
+        return _claude_ttys_cache[1]
+    ttys = _scan_claude_ttys()
+    _claude_ttys_cache = (now, ttys) if ttys is not None else None
+    return ttys
+
+
+def _scan_claude_ttys() -> set[str] | None:
+    """Find every tty hosting an interactive Claude Code session in one scan.
 
     Matches 'claude' commands (by basename) without -p/--print flags
     (non-interactive mode). Returns tty names without the /dev/ prefix
-    (matching ps output), or None when ps itself failed — callers must treat
-    None as "unknown", not "nothing running", or a transient ps failure would
-    mass-prune live sessions.
+    (matching ps output), or None when the scan itself failed — callers must
+    treat None as "unknown", not "nothing running", or a transient failure
+    would mass-prune live sessions.
+
+    On Linux /proc is read directly (no fork); ps is the portable fallback.
     """
+    if sys.platform.startswith("linux"):
+        ttys = _claude_ttys_from_proc()
+        if ttys is not None:
+            return ttys
+    return _claude_ttys_ps()
+
+
+def _is_interactive_claude(argv: list[str]) -> bool:
+    """Whether a command line is an interactive (not -p/--print) claude."""
+    # Handle paths like /usr/local/bin/claude
+    if not argv or os.path.basename(argv[0]).lower() != "claude":
+        return False
+    return "-p" not in argv[1:] and "--print" not in argv[1:]
+
+
+def _pts_name(tty_nr: int) -> str | None:
+    """Map a /proc/<pid>/stat tty_nr to its ps-style name (e.g. "pts/3")."""
+    if os.major(tty_nr) != PTS_MAJOR:
+        return None  # no controlling tty, or a console/serial line
+    return f"pts/{os.minor(tty_nr)}"
+
+
+def _claude_ttys_from_proc() -> set[str] | None:
+    """Collect interactive claude ttys by walking /proc; None if unreadable."""
+    try:
+        entries = [entry.name for entry in os.scandir(PROC_DIR) if entry.name.isdigit()]
+    except OSError:
+        return None
+
+    ttys: set[str] = set()
+    for pid in entries:
+        try:
+            with open(f"{PROC_DIR}/{pid}/cmdline", "rb") as f:
+                cmdline = f.read()
+            # Same view as ps args=: NUL-separated argv, joined and re-split
+            # (process.title rewrites can leave padding in place of argv).
+            if not _is_interactive_claude(os.fsdecode(cmdline.replace(b"\0", b" ")).split()):
+                continue
+            with open(f"{PROC_DIR}/{pid}/stat", "rb") as f:
+                stat = f.read()
+        except OSError:
+            continue  # process exited mid-scan or is not ours to read
+
+        # comm (field 2) may contain spaces or parens; fields resume after
+        # the last ')': state, ppid, pgrp, session, tty_nr.
+        fields = stat.rpartition(b")")[2].split()
+        if len(fields) < 5:
+            continue
+        tty = _pts_name(int(fields[4]))
+        if tty:
+            ttys.add(tty)
+    return ttys
+
+
+def _claude_ttys_ps() -> set[str] | None:
+    """Collect interactive claude ttys from one ps scan; None if ps failed."""
     try:
         result = subprocess.run(
             ["ps", "-eo", "tty=,args="],
@@ -576,21 +782,25 @@ def _interactive_claude_ttys() -> set[str] | None:
         return None
     if result.returncode != 0:
         return None
+    return _claude_ttys_from_ps(result.stdout)
 
+
+def _claude_ttys_from_ps(output: str) -> set[str]:
+    """Collect ttys of interactive claude commands from `ps -o tty=,args=` output."""
     ttys: set[str] = set()
-    for line in result.stdout.splitlines():
-        parts = line.split()
+    for line in output.splitlines():
+        parts = line.split(None, 2)
         if len(parts) < 2:
             continue
-        tty, cmd, args = parts[0], parts[1], parts[2:]
+        tty, cmd = parts[0], parts[1]
         if tty.startswith("?"):  # no controlling terminal
             continue
-        # Handle paths like /usr/local/bin/claude
+        # Reject on the command name before tokenizing its arguments
         if os.path.basename(cmd).lower() != "claude":
             continue
-        if "-p" in args or "--print" in args:
-            continue  # Skip non-interactive mode
-        ttys.add(tty)
+        args = parts[2].split() if len(parts) > 2 else []
+        if _is_interactive_claude([cmd, *args]):
+            ttys.add(tty)
     return ttys
 
 
@@ -599,24 +809,11 @@ def _claude_panes_from_ttys(claude_ttys: set[str]) -> list[dict]:
 
     Filters out the conductor session — it must never be cycled into.
     """
-    output = run_tmux(
-        "list-panes",
-        "-a",
-        "-F",
-        "#{pane_id}\t#{pane_tty}\t#{pane_current_path}\t#{session_name}\t#{window_index}",
-    )
+    output = run_tmux("list-panes", "-a", "-F", CLAUDE_PANES_FORMAT)
 
     conductor_session = _get_conductor_session()
     panes = []
-    for line in output.split("\n"):
-        if not line:
-            continue
-
-        parts = line.split("\t", maxsplit=4)
-        if len(parts) < 5:
-            continue
-
-        pane_id, tty, cwd, session, window_str = parts
+    for pane_id, tty, cwd, session, window_str in _tsv_rows(output, 5):
 
         if session == conductor_session:
             continue
@@ -659,80 +856,98 @@ def get_running_claude_pane_ids() -> set[str] | None:
     return {p["id"] for p in _claude_panes_from_ttys(claude_ttys)}
 
 
-def get_hop_panes(validate: bool = True) -> list[PaneInfo]:
-    """Get all panes with hop state set.
-
-    Args:
-        validate: If True, filter out panes where Claude Code is no longer running.
-                  Set to False for operations like prune that need to see stale panes.
+def _list_panes_filtered(fmt: str, use_filter: bool = True) -> str:
+    """List panes across all sessions, letting tmux drop panes without hop state.
 
-    Returns:
-        List of PaneInfo objects for panes with hop state.
+    Falls back to an unfiltered listing when the server rejects -f (older
+    tmux); callers still check the state column, so results are identical.
+    The rejection is probed quietly and stored in LIST_FILTER_OPTION by the
+    same call that lists, so later processes skip the probe entirely.
     """
-    # Get running Claude panes for validation
-    running_pane_ids = get_running_claude_pane_ids() if validate else None
-    conductor_session = _get_conductor_session()
+    if use_filter:
+        try:
+            return run_tmux(
+                "list-panes", "-a", "-f", HOP_STATE_FILTER, "-F", fmt, quiet=True
+            )
+        except RuntimeError:
+            log_debug("list-panes -f unsupported; listing unfiltered from now on")
+            return run_tmux(
+                "set-option", "-g", LIST_FILTER_OPTION, "off", ";",
+                "list-panes", "-a", "-F", fmt,
+            )
+    return run_tmux("list-panes", "-a", "-F", fmt)
 
-    # Query all panes with hop options
-    # Format: pane_id \t state \t timestamp \t cwd \t session \t window
-    #         \t task \t wait_reason \t project \t branch
-    output = run_tmux(
-        "list-panes",
-        "-a",
-        "-F",
-        "#{pane_id}\t#{@hop-state}\t#{@hop-timestamp}\t#{pane_current_path}\t#{session_name}\t#{window_index}\t#{@hop-task}\t#{@hop-wait-reason}\t#{@hop-project}\t#{@hop-branch}",
-    )
 
-    panes = []
-    for line in output.split("\n"):
-        if not line:
-            continue
+def _iter_hop_rows() -> Iterator[list[str]]:
+    """Yield raw hop-pane rows, padded to HOP_ROW_FIELDS columns.
 
-        parts = line.split("\t", maxsplit=9)
-        if len(parts) < 6:
-            continue
+    Rows without hop state and rows in the conductor session are dropped
+    here, before any int parsing or PaneInfo construction.
+    """
+    conductor_session, use_filter = _get_listing_settings()
 
-        pane_id, state, timestamp_str, cwd, session, window_str = parts[:6]
-        task = parts[6] if len(parts) >= 7 else ""
-        wait_reason = parts[7] if len(parts) >= 8 else ""
-        repo = parts[8] if len(parts) >= 9 else ""
-        branch = parts[9] if len(parts) >= 10 else ""
+    # Query all panes with hop options (columns: see HOP_PANES_FORMAT)
+    output = _list_panes_filtered(HOP_PANES_FORMAT, use_filter)
 
-        # Only include panes with hop state
-        if not state:
+    for parts in _tsv_rows(output, HOP_ROW_FIELDS, min_fields=7):
+        # Only include panes with hop state (the -f filter may be unavailable)
+        if not parts[2]:
             continue
 
         # Conductor session is never part of the hop cycle.
-        if session == conductor_session:
+        if parts[5] == conductor_session:
             continue
 
-        # Skip stale panes if validating
-        if running_pane_ids is not None and pane_id not in running_pane_ids:
-            continue
+        if len(parts) < HOP_ROW_FIELDS:
+            parts += [""] * (HOP_ROW_FIELDS - len(parts))
+        yield parts
 
-        try:
-            timestamp = int(timestamp_str) if timestamp_str else 0
-            window = int(window_str) if window_str else 0
-        except ValueError:
-            timestamp = 0
-            window = 0
-
-        panes.append(
-            PaneInfo(
-                id=pane_id,
-                state=state,
-                timestamp=timestamp,
-                cwd=cwd,
-                session=session,
-                window=window,
-                task=task,
-                wait_reason=wait_reason,
-                repo=repo,
-                branch=branch,
-            )
-        )
 
-    return panes
+def _pane_from_row(row: list[str]) -> PaneInfo:
+    """Build a PaneInfo from a padded row yielded by _iter_hop_rows."""
+    pane_id, tty, state, timestamp_str, cwd, session, window_str, task, wait_reason, repo, branch = row
+    try:
+        timestamp = int(timestamp_str) if timestamp_str else 0
+        window = int(window_str) if window_str else 0
+    except ValueError:
+        timestamp = 0
+        window = 0
+
+    return PaneInfo(
+        id=pane_id,
+        state=state,
+        timestamp=timestamp,
+        cwd=cwd,
+        session=session,
+        window=window,
+        task=task,
+        wait_reason=wait_reason,
+        repo=repo,
+        branch=branch,
+        tty=tty,
+    )
+
+
+def get_hop_panes(validate: bool = True) -> list[PaneInfo]:
+    """Get all panes with hop state set.
+
+    Args:
+        validate: If True, filter out panes where Claude Code is no longer running.
+                  Set to False for operations like prune that need to see stale panes.
+
+    Returns:
+        List of PaneInfo objects for panes with hop state.
+    """
+    # Validation compares the listing's own tty column against the process
+    # scan, so no second list-panes is needed. None (scan failed) keeps all.
+    claude_ttys = _interactive_claude_ttys() if validate else None
+
+    # Skip stale panes if validating
+    return [
+        _pane_from_row(row)
+        for row in _iter_hop_rows()
+        if claude_ttys is None or row[1].removeprefix("/dev/") in claude_ttys
+    ]
 
 
 def get_stale_panes() -> list[PaneInfo]:
@@ -743,11 +958,16 @@ def get_stale_panes() -> list[PaneInfo]:
         Empty when the process scan failed — better to prune nothing than
         to prune live sessions.
     """
-    running_pane_ids = get_running_claude_pane_ids()
-    if running_pane_ids is None:
+    # The hop listing already carries each pane's tty, so liveness is a
+    # membership check against one process scan — no second list-panes.
+    claude_ttys = _interactive_claude_ttys()
+    if claude_ttys is None:
         return []
-    all_hop_panes = get_hop_panes(validate=False)
-    return [p for p in all_hop_panes if p.id not in running_pane_ids]
+    return [
+        _pane_from_row(row)
+        for row in _iter_hop_rows()
+        if row[1].removeprefix("/dev/") not in claude_ttys  # tty is the second column
+    ]
 
 
 def switch_to_pane(
@@ -767,27 +987,19 @@ def switch_to_pane(
     Returns:
         True if switch was successful, False if pane not found or tmux rejected the switch
     """
-    # Capture origin up front; persist only after a successful switch so a
-    # failed call can't poison @hop-previous-pane.
-    origin_pane = get_current_pane() if store_previous else None
+    # Capture origin (and where we are now) up front in one tmux call;
+    # origin is persisted only by a successful switch (end of the chain
+    # below) so a failed call can't poison @hop-previous-pane.
+    origin_pane, current_session, current_window = _get_current_location()
 
-    # Look up session if not provided
+    # Look up session if not provided: a targeted display-message resolves
+    # just this pane instead of listing every pane on the server.
     if target_session is None:
-        output = run_tmux(
-            "list-panes",
-            "-a",
-            "-F",
-            "#{pane_id}\t#{session_name}\t#{window_index}",
-        )
-
-        for line in output.split("\n"):
-            if not line:
-                continue
-            parts = line.split("\t", maxsplit=2)
-            if len(parts) >= 3 and parts[0] == pane_id:
-                target_session = parts[1]
-                target_window = int(parts[2]) if parts[2] else None
-                break
+        try:
+            # A closed pane is routine here (e.g. jumping back), not an error
+            target_session, target_window = get_current_session_window(pane_id, quiet=True)
+        except RuntimeError:
+            target_session = ""
 
         if not target_session:
             run_tmux(
@@ -796,28 +1008,29 @@ def switch_to_pane(
             )
             return False
 
-    # Get current session and window
-    current_session, current_window = get_current_session_window()
-
-    # Any of switch-client/select-window/select-pane may fail if the target
-    # has disappeared between lookup and now; report that as a soft failure
+    # Navigation is one ";"-chained tmux invocation. Any of switch-client/
+    # select-window/select-pane may fail if the target has disappeared between
+    # lookup and now (tmux then stops the chain); report that as a soft failure
     # so callers (cmd_cycle, etc.) can prune stale entries instead of crashing.
+    args: list[str] = []
+    if target_session != current_session:
+        if target_window is not None:
+            args += ["switch-client", "-t", f"{target_session}:{target_window}", ";"]
+        else:
+            args += ["switch-client", "-t", target_session, ";"]
+    elif target_window is not None and target_window != current_window:
+        args += ["select-window", "-t", f"{target_session}:{target_window}", ";"]
+    args += ["select-pane", "-t", pane_id]
+    # Last in the chain, so the origin is recorded only once every
+    # navigation step succeeded.
+    if store_previous and origin_pane and origin_pane != pane_id:
+        args += [";", "set-option", "-g", "@hop-previous-pane", origin_pane]
+
     try:
-        if target_session != current_session:
-            if target_window is not None:
-                run_tmux("switch-client", "-t", f"{target_session}:{target_window}")
-            else:
-                run_tmux("switch-client", "-t", target_session)
-        elif target_window is not None and target_window != current_window:
-            run_tmux("select-window", "-t", f"{target_session}:{target_window}")
-
-        run_tmux("select-pane", "-t", pane_id)
+        run_tmux(*args)
     except RuntimeError:
         return False
 
-    if origin_pane and origin_pane != pane_id:
-        set_global_option("@hop-previous-pane", origin_pane)
-
     return True
 
 
@@ -837,9 +1050,62 @@ def capture_pane_content(pane_id: str, last_lines: int = 15) -> str:
     )
 
 
+def capture_panes_content(pane_ids: list[str], last_lines: int = 15) -> dict[str, str]:
+    """Capture several panes in one ";"-chained tmux invocation.
+
+    Each capture is preceded by a CAPTURE_SENTINEL line so the combined
+    output can be split back per pane. tmux stops a chain at the first
+    failing command (e.g. a pane that just closed), so panes whose segment
+    never arrived are captured individually.
+
+    Returns:
+        Mapping of pane ID to captured content ("" on failure)
+    """
+    if len(pane_ids) <= 1:
+        return {pane_id: capture_pane_content(pane_id, last_lines) for pane_id in pane_ids}
+
+    args: list[str] = []
+    for pane_id in pane_ids:
+        if args:
+            args.append(";")
+        args += ["display-message", "-p", CAPTURE_SENTINEL,
+                 ";", "capture-pane", "-t", pane_id, "-p", "-S", f"-{last_lines}"]
+    output = run_tmux(*args, check=False)
+
+    segments: list[list[str]] = []
+    for line in output.splitlines():
+        if line == CAPTURE_SENTINEL:
+            segments.append([])
+        elif segments:
+            segments[-1].append(line)
+    if len(segments) > len(pane_ids):
+        segments = []  # a pane displayed the sentinel itself; don't trust the split
+
+    contents = {
+        pane_id: "\n".join(lines).strip()
+        for pane_id, lines in zip(pane_ids, segments)
+    }
+    for pane_id in pane_ids[len(segments):]:
+        contents[pane_id] = capture_pane_content(pane_id, last_lines)
+    return contents
+
+
 def _is_separator_line(stripped: str) -> bool:
     """Check if a line is a Claude Code status bar separator (all ─ chars)."""
-    return bool(stripped) and all(c == STATUS_SEPARATOR for c in stripped)
+    return bool(stripped) and not stripped.strip(STATUS_SEPARATOR)
+
+
+def _iter_lines_reversed(content: str) -> Iterator[str]:
+    """Yield lines from the bottom up, slicing with rfind instead of splitting.
+
+    has_active_dialog usually stops within the last few lines, so this avoids
+    materializing every line of the capture.
+    """
+    end = len(content)
+    while end >= 0:
+        start = content.rfind("\n", 0, end) + 1
+        yield content[start:end]
+        end = start - 1
 
 
 def has_active_dialog(content: str) -> bool:
@@ -865,12 +1131,10 @@ def has_active_dialog(content: str) -> bool:
     if not content or not content.strip():
         return True  # Conservative: empty/whitespace = assume active
 
-    lines = content.splitlines()
-
     # Scan from bottom: skip status metadata, find first separator,
     # then check whether the line above it is the input prompt.
     found_separator = False
-    for line in reversed(lines):
+    for line in _iter_lines_reversed(content):
         stripped = line.strip()
         if not stripped:
             continue
@@ -881,7 +1145,7 @@ def has_active_dialog(content: str) -> bool:
 
         if found_separator:
             # First content line above a separator
-            if stripped == PROMPT_CHAR or stripped.startswith(f"{PROMPT_CHAR} "):
+            if stripped == PROMPT_CHAR or stripped.startswith(PROMPT_PREFIX):
                 return False  # Input prompt visible → dialog dismissed
             break  # Not the prompt → dialog or other content
 
@@ -903,14 +1167,16 @@ def validate_waiting_panes(panes: list[PaneInfo]) -> None:
     """
     now = int(time.time())
 
-    for pane in panes:
-        if pane.state != "waiting":
-            continue
-
-        if (now - pane.timestamp) < WAITING_STALE_THRESHOLD:
-            continue
+    stale = [
+        pane for pane in panes
+        if pane.state == "waiting" and (now - pane.timestamp) >= WAITING_STALE_THRESHOLD
+    ]
+    if not stale:
+        return
+    contents = capture_panes_content([pane.id for pane in stale])
 
-        content = capture_pane_content(pane.id)
+    for pane in stale:
+        content = contents.get(pane.id, "")
         if not content:
             continue  # Pane gone or empty, skip
 
@@ -918,7 +1184,7 @@ def validate_waiting_panes(panes: list[PaneInfo]) -> None:
             continue
 
         try:
-            set_pane_state("idle", pane.id)
+            set_pane_state("idle", pane.id, timestamp=now)
         except RuntimeError:
             continue  # Pane may have disappeared
 